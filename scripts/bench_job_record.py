@@ -0,0 +1,120 @@
+"""
+Memory benchmark: scraped jobs held as dicts vs JobRecord.
+
+Builds N synthetic jobs shaped like parse_job_page output (repeated
+companies, locations, badges and skills; unique URLs and descriptions, each
+job's strings freshly allocated the way the parser produces them) and
+measures the retained size of each representation with tracemalloc.
+
+    python scripts/bench_job_record.py --jobs 100000
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from dice_job_scraper.models import JobRecord
+
+COMPANIES = [f"Company {i} Inc." for i in range(800)]
+LOCATIONS = [f"City {i}, ST" for i in range(400)] + ["Remote"]
+TITLES = [f"{level} {role}" for level in ("Senior", "Lead", "Staff", "Junior", "")
+          for role in ("Java Developer", "Data Engineer", "DevOps Engineer", "QA Analyst", "Python Developer")]
+SKILLS = ["Java", "Python", "AWS", "Kubernetes", "SQL", "Spark", "React", "Terraform", "Docker", "Azure",
+          "Kafka", "Go", "C#", ".NET", "Linux", "Snowflake"]
+WORK = ["Remote", "Hybrid in Austin, TX", "On-Site"]
+POSITION_TYPES = ["Contract", "Full-time", "Contract to Hire", "Third Party"]
+RECRUITERS = [f"Recruiter {i}" for i in range(2000)]
+WORDS = "design build maintain scalable services team cloud data pipelines agile deliver".split()
+
+
+def fresh(text: str) -> str:
+    # Parsers return a new string object per page even for equal text
+    return "".join(list(text))
+
+
+def make_job(i: int, rng: random.Random) -> dict:
+    company = rng.choice(COMPANIES)
+    return {
+        "title": fresh(rng.choice(TITLES)),
+        "company": fresh(company),
+        "location": fresh(rng.choice(LOCATIONS)),
+        "url": f"https://www.dice.com/job-detail/{i:08x}-{rng.getrandbits(64):016x}",
+        "Company Name": fresh(company),
+        "Company Link": fresh(f"https://www.dice.com/company-profile/{COMPANIES.index(company)}"),
+        "Job Title": fresh(rng.choice(TITLES)),
+        "Location": fresh(rng.choice(LOCATIONS)),
+        "Posted Date": fresh(f"Posted {rng.randint(1, 30)} days ago"),
+        "Position Types": [fresh(t) for t in rng.sample(POSITION_TYPES, 2)],
+        "Work Arrangement": [fresh(rng.choice(WORK))],
+        "Pay Information": rng.choice([fresh("Not Available"), [fresh(f"USD {rng.randint(40, 120)}.00 per hour")]]),
+        "Other Badges": fresh("Not Available"),
+        "Employment Type": fresh(rng.choice(POSITION_TYPES)),
+        "Travel Requirements": fresh("Not Available"),
+        "Primary Skill Set": [fresh(s) for s in rng.sample(SKILLS, 6)],
+        "Job Description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(150, 400))),
+        "Recruiter Name": fresh(rng.choice(RECRUITERS)),
+        "Recruiter Title": fresh("Technical Recruiter"),
+        "Recruiter Company": fresh(company),
+        "Recruiter Profile Link": fresh("Not Available"),
+    }
+
+
+def measure(build) -> tuple[int, float]:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return size, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--no-descriptions", action="store_true",
+                        help="Drop Job Description to compare the structured fields only")
+    args = parser.parse_args()
+
+    def dicts():
+        rng = random.Random(7)
+        jobs = [make_job(i, rng) for i in range(args.jobs)]
+        if args.no_descriptions:
+            for job in jobs:
+                del job["Job Description"]
+        return jobs
+
+    def records():
+        rng = random.Random(7)
+        result = []
+        for i in range(args.jobs):
+            job = make_job(i, rng)
+            if args.no_descriptions:
+                del job["Job Description"]
+            result.append(JobRecord.from_dict(job))
+        return result
+
+    dict_bytes, dict_s = measure(dicts)
+    record_bytes, record_s = measure(records)
+
+    sample = dicts()[:1000]
+    assert all(JobRecord.from_dict(job).to_dict() == job for job in sample)
+
+    started = time.perf_counter()
+    converted = [record.to_dict() for record in map(JobRecord.from_dict, sample)]
+    roundtrip_us = (time.perf_counter() - started) / len(converted) * 1e6
+
+    mb = 1024 * 1024
+    print(f"jobs:            {args.jobs}")
+    print(f"dicts:           {dict_bytes / mb:8.1f} MiB  ({dict_bytes / args.jobs:,.0f} B/job, built in {dict_s:.2f}s)")
+    print(f"JobRecord:       {record_bytes / mb:8.1f} MiB  ({record_bytes / args.jobs:,.0f} B/job, built in {record_s:.2f}s)")
+    print(f"saved:           {(1 - record_bytes / dict_bytes) * 100:8.1f} %")
+    print(f"round trip:      {roundtrip_us:8.1f} us/job (from_dict + to_dict)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Query benchmark: MatchIndex.scores and top-k selection at scale.
+
+Builds an index of N synthetic rows through MatchIndex.add_vectors (~200
+entries per row, buckets drawn from a Zipf-like distribution over the 2**18
+buckets the way hashed description terms are, so common buckets have long
+posting lists) and times queries drawn from the same distribution.
+
+    python scripts/bench_match_index.py --jobs 1000000 --index /tmp/match_bench
+"""
+import argparse
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+
+from dice_job_scraper.matching import DIM, MatchIndex
+
+BATCH_ROWS = 10_000
+
+
+def bucket_sampler(rng: np.random.Generator):
+    # Zipf-like term frequencies over a random permutation of the buckets
+    weights = 1.0 / np.arange(1, DIM + 1) ** 0.9
+    cdf = np.cumsum(weights) / weights.sum()
+    permutation = rng.permutation(DIM).astype(np.int32)
+    return lambda size: permutation[np.searchsorted(cdf, rng.random(size))]
+
+
+def make_batch(first: int, rows: int, entries: int, sample, rng: np.random.Generator):
+    keys = np.unique(np.repeat(np.arange(rows, dtype=np.int64), entries) * DIM + sample(rows * entries))
+    entry_rows, indices = keys // DIM, (keys % DIM).astype(np.int32)
+    values = rng.random(len(keys)).astype(np.float32)
+    values /= np.sqrt(np.bincount(entry_rows, weights=values ** 2, minlength=rows))[entry_rows]
+    indptr = np.zeros(rows + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(entry_rows, minlength=rows))
+    metas = [{"url": f"https://www.dice.com/job-detail/{first + i:08x}"} for i in range(rows)]
+    return metas, np.zeros(rows, dtype=np.uint32), indptr, indices, values
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=1_000_000)
+    parser.add_argument("--entries", type=int, default=230, help="Sampled terms per row (~200 distinct buckets)")
+    parser.add_argument("--query-terms", type=int, default=150)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--index", default="output/match_bench")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    sample = bucket_sampler(rng)
+    shutil.rmtree(args.index, ignore_errors=True)
+
+    started = time.perf_counter()
+    index = MatchIndex(args.index)
+    for first in range(0, args.jobs, BATCH_ROWS):
+        index.add_vectors(*make_batch(first, min(BATCH_ROWS, args.jobs - first), args.entries, sample, rng))
+    build_s = time.perf_counter() - started
+
+    timings = []
+    for _ in range(args.queries):
+        query = np.zeros(DIM, dtype=np.float32)
+        query[sample(args.query_terms)] = rng.random(args.query_terms)
+        started = time.perf_counter()
+        scores = index.scores(query / np.linalg.norm(query))
+        np.argpartition(-scores, 49)[:50]
+        timings.append(time.perf_counter() - started)
+
+    disk = sum(path.stat().st_size for path in Path(args.index).iterdir())
+    print(f"jobs:            {len(index)}")
+    print(f"entries:         {index.entries} ({index.entries / len(index):.0f}/job), postings slots {index.postings}")
+    print(f"build:           {build_s:8.1f} s")
+    print(f"disk:            {disk / 1024 ** 3:8.2f} GiB (files incl. unused capacity)")
+    print(f"query median:    {np.median(timings) * 1000:8.1f} ms")
+    print(f"query max:       {max(timings) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,182 @@
 from playwright.async_api import async_playwright
+import fcntl
+import json
 import logging
+import os
+import shutil
+import statistics
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-async def create_browser(headless=True):
+# Chromium disk cache directories inside a user-data dir; pruned when over the size limit.
+CACHE_DIRS = ("Default/Cache", "Default/Code Cache", "GrShaderCache", "ShaderCache")
+LOCK_FILE = ".dice-scraper.lock"
+# Cookies/local storage exported by the run holding the lock, for concurrent runs.
+STORAGE_SNAPSHOT = "storage_state.json"
+TIMINGS_FILE = "first_listing_timings.json"
+TIMINGS_KEPT = 20
+
+
+async def create_browser(
+        headless=True,
+        user_data_dir: str | None = None,
+        cache_size_mb: int | None = None,
+        storage_state: str | None = None,
+):
     playwright = await async_playwright().start()
-    browser = await playwright.chromium.launch(headless=headless)
-    context = await browser.new_context()
-    page = await context.new_page()
-    return playwright, browser, context, page
+    args = [f"--disk-cache-size={cache_size_mb * 1024 * 1024}"] if cache_size_mb else []
+
+    try:
+        if user_data_dir is not None:
+            # Persistent profile: cookies, local storage and the HTTP disk cache survive runs.
+            context = await playwright.chromium.launch_persistent_context(
+                user_data_dir, headless=headless, args=args
+            )
+            page = context.pages[0] if context.pages else await context.new_page()
+            return playwright, None, context, page
+
+        # new_context() is off-the-record: its HTTP cache lives in memory for this run only.
+        browser = await playwright.chromium.launch(headless=headless, args=args)
+        if storage_state and Path(storage_state).exists():
+            context = await browser.new_context(storage_state=storage_state)
+        else:
+            context = await browser.new_context()
+        page = await context.new_page()
+        return playwright, browser, context, page
+    except BaseException:
+        # Launch failed (e.g. browser not installed): don't leave the driver running
+        await playwright.stop()
+        raise
+
+
+async def save_storage_state(context, path: str) -> None:
+    # Write to a temp file and swap it in so concurrent runs never read a partial file.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    await context.storage_state(path=tmp_path)
+    os.replace(tmp_path, path)
+    logger.info("Storage state saved | path=%s", path)
+
+
+async def close_browser(playwright, browser, context, storage_state: str | None = None):
+    if storage_state:
+        await save_storage_state(context, storage_state)
+
+    await context.close()
+    if browser is not None:
+        await browser.close()
+    await playwright.stop()
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+class BrowserProfile:
+    """
+    A Chromium user-data dir reused across runs, with a size cap on its cache.
+
+    Chromium refuses to share one user-data dir between processes, so the
+    first run takes an flock on a lock file, held until release (or until the
+    process dies, so a crashed run never leaves a stale lock). The live profile is never copied: its cache
+    and SQLite files are being written by the owning browser. A concurrent
+    run instead gets a fresh, off-the-record context seeded from the owner's
+    last exported storage state (STORAGE_SNAPSHOT); its HTTP cache is in
+    memory only and starts cold.
+    """
+
+    def __init__(self, path: str, cache_size_mb: int = 256):
+        self.path = Path(path)
+        self.cache_size_mb = cache_size_mb
+        self.cache_state = "cold"
+        self._lock_fd = None
+
+    def acquire(self) -> dict:
+        """Lock the profile and return the create_browser options for this run."""
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        if self._try_lock():
+            self._prune_cache()
+            self.cache_state = "warm" if any(
+                (self.path / cache_dir).exists() for cache_dir in CACHE_DIRS
+            ) else "cold"
+            logger.info("Using browser profile | path=%s | cache=%s", self.path, self.cache_state)
+            return {"user_data_dir": str(self.path)}
+
+        self.cache_state = "cold"
+        snapshot = self.path / STORAGE_SNAPSHOT
+        logger.info("Browser profile in use by another run, using its storage snapshot | path=%s", self.path)
+        return {"storage_state": str(snapshot) if snapshot.exists() else None}
+
+    async def save_storage_snapshot(self, context) -> None:
+        """Export cookies/local storage for concurrent runs (lock owner only)."""
+        if self._lock_fd is not None:
+            await save_storage_state(context, str(self.path / STORAGE_SNAPSHOT))
+
+    def release(self) -> None:
+        # The lock file itself stays: unlinking it would let a later run lock a
+        # new file while another still holds the old one
+        if self._lock_fd is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def _try_lock(self) -> bool:
+        fd = os.open(self.path / LOCK_FILE, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        # Owner's PID, for whoever finds the profile busy
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._lock_fd = fd
+        return True
+
+    def _prune_cache(self) -> None:
+        limit = self.cache_size_mb * 1024 * 1024
+        size = _dir_size(self.path)
+        if size <= limit:
+            return
+
+        logger.info(
+            "Browser profile over size limit, clearing cache | size_mb=%.0f | limit_mb=%s",
+            size / 1024 / 1024,
+            self.cache_size_mb,
+        )
+        for cache_dir in CACHE_DIRS:
+            shutil.rmtree(self.path / cache_dir, ignore_errors=True)
+
+    def record_first_listing(self, seconds: float) -> dict:
+        """
+        Store this run's time-to-first-listing and return warm vs cold medians
+        over recent runs for the run summary.
+        """
+        timings_path = self.path / TIMINGS_FILE
+        try:
+            timings = json.loads(timings_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            timings = {}
+
+        runs = timings.setdefault(self.cache_state, [])
+        runs.append(round(seconds, 3))
+        del runs[:-TIMINGS_KEPT]
+
+        tmp_path = timings_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(timings), encoding="utf-8")
+        os.replace(tmp_path, timings_path)
+
+        return {
+            "cache": self.cache_state,
+            "seconds": round(seconds, 3),
+            "median_warm_s": statistics.median(timings["warm"]) if timings.get("warm") else None,
+            "median_cold_s": statistics.median(timings["cold"]) if timings.get("cold") else None,
+        }
@@ -1,14 +1,24 @@
 import argparse
 import asyncio
+import contextlib
 import logging
 import signal
+import sys
+import time
 from pathlib import Path
 import json
 
-from .browser import create_browser
+from .browser import BrowserProfile, close_browser, create_browser
 from .scraper import scrape_pages
 from .config import DEFAULT_QUERY_PARAMS
+from .exporter import write_run_summary
 from .logging_config import setup_logging
+from .profiling import RunProfiler, profile_section
+from .store import JobStore
+from .dedup import DuplicateIndex
+from .report import build_report, format_report, iter_job_batches
+from .job_details import BADGE_FLAGS
+from .matching import MatchIndex
 
 shutdown_event = asyncio.Event()
 PROGRESS_PATH = Path("progress.json")
@@ -58,7 +68,31 @@ async def async_main():
     parser.add_argument("--headed", action="store_true")
     parser.add_argument("--log-level", default="INFO")
     parser.add_argument("--resume", action="store_true",
-                        help="Resume from last_completed_page if progress.json exists")
+                        help="Resume from last_completed_page if progress.json exists, "
+                             "retrying the jobs left in <output-dir>/retry_queue.jsonl")
+    parser.add_argument("--extraction", choices=["html", "dom"], default="html",
+                        help="html: serialize page and parse with BeautifulSoup; "
+                             "dom: extract fields in-page with one evaluate call")
+    parser.add_argument("--browser-profile", default=None,
+                        help="Persistent Chromium user-data dir; keeps cookies and HTTP cache across runs")
+    parser.add_argument("--browser-cache-mb", type=int, default=256,
+                        help="Disk cache size limit for --browser-profile")
+    parser.add_argument("--storage-state", default=None,
+                        help="Load/save cookies and local storage from this JSON file")
+    parser.add_argument("--store", default=None,
+                        help="SQLite job store to upsert into while scraping (e.g. output/jobs.db)")
+    parser.add_argument("--dedup", action="store_true",
+                        help="Tag near-duplicate job descriptions with a cluster ID")
+    parser.add_argument("--dedup-index", default=None,
+                        help="Load/save the near-duplicate index here across runs (implies --dedup)")
+    parser.add_argument("--suppress-duplicates", action="store_true",
+                        help="With --dedup, do not export or store near-duplicates")
+    parser.add_argument("--match-index", default=None,
+                        help="Append scraped jobs to this resume-matching index dir (e.g. output/match_index)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Write CPU, allocation and asyncio task profiles to --output-dir")
+    parser.add_argument("--profile-top", type=int, default=25,
+                        help="Number of allocation sites in the profile report")
 
     args = parser.parse_args()
 
@@ -70,25 +104,81 @@ async def async_main():
     resume_meta = load_resume_metadata() if args.resume else None
     start_page = (resume_meta["last_completed_page"] + 1) if resume_meta else 1
 
-    playwright, browser, context, list_page = await create_browser(
-        headless=not args.headed
-    )
-
-    detail_page = await context.new_page()
+    # Everything acquired below is released by the exit stack, in reverse
+    # order, even when a later step (browser launch, index load) fails.
+    async with contextlib.AsyncExitStack() as stack:
+        browser_profile = None
+        launch_options = {}
+        if args.browser_profile:
+            browser_profile = BrowserProfile(args.browser_profile, cache_size_mb=args.browser_cache_mb)
+            launch_options = browser_profile.acquire()
+            stack.callback(browser_profile.release)
 
-    try:
-        jobs, csv_path = await scrape_pages(
-            list_page=list_page,
-            detail_page=detail_page,
-            query_params=DEFAULT_QUERY_PARAMS,
-            max_pages=args.pages,
-            jobs_per_page=args.jobs_per_page,
-            output_dir=args.output_dir,
-            start_page=start_page,          # new
-            shutdown_event=shutdown_event,  # new
-            save_progress=save_resume_metadata,  # callback
+        playwright, browser, context, list_page = await create_browser(
+            headless=not args.headed,
+            user_data_dir=launch_options.get("user_data_dir"),
+            cache_size_mb=args.browser_cache_mb if browser_profile else None,
+            storage_state=args.storage_state or launch_options.get("storage_state"),
         )
 
+        async def shutdown_browser() -> None:
+            try:
+                if browser_profile is not None:
+                    await browser_profile.save_storage_snapshot(context)
+            finally:
+                await close_browser(playwright, browser, context, storage_state=args.storage_state)
+
+        stack.push_async_callback(shutdown_browser)
+
+        detail_page = await context.new_page()
+
+        profiler = None
+        if args.profile:
+            profiler = RunProfiler(args.output_dir, top_n=args.profile_top)
+            profiler.start(asyncio.get_running_loop())
+            stack.callback(profiler.stop)
+
+        store = None
+        if args.store:
+            store = JobStore(args.store)
+            stack.callback(store.close)
+
+        match_index = MatchIndex(args.match_index) if args.match_index else None
+
+        dedup = None
+        if args.dedup_index:
+            dedup = DuplicateIndex.load(args.dedup_index)
+            stack.callback(dedup.save, args.dedup_index)
+        elif args.dedup or args.suppress_duplicates:
+            dedup = DuplicateIndex()
+
+        run_summary = {}
+
+        async def scrape():
+            with profile_section("scrape_loop"):
+                return await scrape_pages(
+                    list_page=list_page,
+                    detail_page=detail_page,
+                    query_params=DEFAULT_QUERY_PARAMS,
+                    max_pages=args.pages,
+                    jobs_per_page=args.jobs_per_page,
+                    output_dir=args.output_dir,
+                    start_page=start_page,          # new
+                    shutdown_event=shutdown_event,  # new
+                    save_progress=save_resume_metadata,  # callback
+                    extraction=args.extraction,
+                    run_summary=run_summary,
+                    store=store,
+                    dedup=dedup,
+                    suppress_duplicates=args.suppress_duplicates,
+                    match_index=match_index,
+                    resume=args.resume,
+                )
+
+        # Own task, created after the profiler's task factory is installed,
+        # so the scrape's loop-holding time is attributed
+        jobs, csv_path = await asyncio.create_task(scrape())
+
         logger.info(
             "Scraping complete",
             extra={
@@ -97,11 +187,143 @@ async def async_main():
             },
         )
 
+        run_summary["total_jobs"] = len(jobs)
+        first_listing = run_summary.pop("time_to_first_listing_s", None)
+        if first_listing is not None:
+            if browser_profile is not None:
+                run_summary["time_to_first_listing"] = browser_profile.record_first_listing(first_listing)
+            else:
+                run_summary["time_to_first_listing"] = {"cache": "ephemeral", "seconds": round(first_listing, 3)}
+        logger.info("Run summary | %s", json.dumps(run_summary))
+        write_run_summary(run_summary, args.output_dir)
+
+
+def search_main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="dice-scraper search", description="Search the SQLite job store"
+    )
+    parser.add_argument("query", nargs="*", help="Full-text terms (title, description, skills)")
+    parser.add_argument("--db", default="output/jobs.db")
+    parser.add_argument("--company")
+    parser.add_argument("--location", help="Location prefix, e.g. 'Albany'")
+    parser.add_argument("--badge", action="append", default=[],
+                        help=f"Badge that must be present: {', '.join(BADGE_FLAGS)} "
+                             "or badge text such as 'Corp To Corp' (repeatable)")
+    parser.add_argument("--posted-within", type=float, metavar="DAYS",
+                        help="Only jobs posted within the last N days")
+    parser.add_argument("--min-rate", type=float, metavar="PER_HOUR",
+                        help="Only jobs whose hourly pay range reaches this rate")
+    parser.add_argument("--currency", default="USD",
+                        help="Currency for --min-rate; pay without a currency counts as this")
+    parser.add_argument("--sort", choices=["relevance", "posted"], default="relevance",
+                        help="relevance: bm25 (newest scraped without terms), posted: newest posting first")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON lines")
+
+    args = parser.parse_args(argv)
+
+    if not Path(args.db).exists():
+        parser.error(f"job store not found: {args.db}")
+
+    store = JobStore(args.db)
+    try:
+        start = time.perf_counter()
+        results = store.search(
+            " ".join(args.query),
+            company=args.company,
+            location=args.location,
+            badges=args.badge,
+            posted_within_days=args.posted_within,
+            min_rate=args.min_rate,
+            currency=args.currency,
+            sort=args.sort,
+            limit=args.limit,
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    except ValueError as e:
+        parser.error(str(e))
     finally:
-        await context.close()
-        await browser.close()
-        await playwright.stop()
+        store.close()
+
+    for job in results:
+        if args.json:
+            print(json.dumps(job, ensure_ascii=False))
+        else:
+            print(" | ".join(str(job[key]) for key in ("title", "company", "location", "posted_at", "url")))
+    print(f"{len(results)} results in {elapsed_ms:.1f} ms", file=sys.stderr)
+
+
+def report_main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="dice-scraper report",
+        description="Hourly rate distributions by skill, location and work arrangement",
+    )
+    parser.add_argument("paths", nargs="+", help="JSONL/Parquet files or directories (e.g. output/)")
+    parser.add_argument("--currency", default="USD")
+    parser.add_argument("--since-days", type=int, default=None,
+                        help="Only jobs posted within the last N days")
+    parser.add_argument("--top", type=int, default=20, help="Groups shown per dimension")
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--log-level", default="WARNING")
+
+    args = parser.parse_args(argv)
+    setup_logging(getattr(logging, args.log_level.upper()))
+
+    report = build_report(
+        args.paths,
+        currency=args.currency,
+        since_days=args.since_days,
+        batch_size=args.batch_size,
+        top=args.top,
+    )
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+def match_main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="dice-scraper match", description="Rank indexed jobs against a resume"
+    )
+    parser.add_argument("resume", help="Plain-text resume")
+    parser.add_argument("--index", default="output/match_index")
+    parser.add_argument("--top", type=int, default=50)
+    parser.add_argument("--require", action="append", default=[], choices=list(BADGE_FLAGS),
+                        help="Badge flag every result must have (repeatable)")
+    parser.add_argument("--exclude", action="append", default=[], choices=list(BADGE_FLAGS),
+                        help="Badge flag no result may have (repeatable)")
+    parser.add_argument("--add-jsonl", nargs="+", default=[],
+                        help="Append jobs from these JSONL exports to the index first")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON lines")
+
+    args = parser.parse_args(argv)
+
+    index = MatchIndex(args.index)
+    for path in args.add_jsonl:
+        for batch in iter_job_batches(Path(path), 10_000, columns=None):
+            index.add_jobs(batch)
+
+    resume_text = Path(args.resume).read_text(encoding="utf-8")
+    start = time.perf_counter()
+    results = index.search(resume_text, top=args.top, require=args.require, exclude=args.exclude)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    for job in results:
+        if args.json:
+            print(json.dumps(job, ensure_ascii=False))
+        else:
+            print(" | ".join(str(job[key]) for key in ("score", "title", "company", "location", "url")))
+    print(f"{len(results)} of {len(index)} jobs in {elapsed_ms:.1f} ms", file=sys.stderr)
+
+
+SUBCOMMANDS = {
+    "search": search_main,
+    "report": report_main,
+    "match": match_main,
+}
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        SUBCOMMANDS[sys.argv[1]](sys.argv[2:])
+        return
     asyncio.run(async_main())
@@ -0,0 +1,237 @@
+import hashlib
+import logging
+import re
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 128
+BANDS = 16  # 16 bands x 8 rows: candidate pairs start showing up around ~0.7 Jaccard
+SHINGLE_SIZE = 3
+SIMILARITY_THRESHOLD = 0.8
+# Bound the (shingles x permutations) matrix built per chunk, ~64 MB of uint64.
+MAX_CHUNK_SHINGLES = 65_536
+
+EMPTY_SIGNATURE_VALUE = np.iinfo(np.uint32).max
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """Stable 32-bit hashes of the word n-grams in text (lowercased, punctuation dropped)."""
+    tokens = _TOKEN_RE.findall(text.lower())
+    if len(tokens) < size:
+        shingles = {" ".join(tokens)} if tokens else set()
+    else:
+        shingles = {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+    return np.fromiter(
+        (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+
+
+def _permutations(num_perm: int, seed: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    # Multiply-shift hashing: odd 64-bit multipliers, uint64 arithmetic wraps mod 2**64.
+    a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+class MinHasher:
+    """Computes MinHash signatures for a batch of texts with vectorized NumPy ops."""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        self.num_perm = num_perm
+        self._a, self._b = _permutations(num_perm, seed)
+
+    def signatures(self, texts: list[str]) -> np.ndarray:
+        """
+        Return a (len(texts), num_perm) uint32 matrix. Texts without any
+        shingle get an all-EMPTY_SIGNATURE_VALUE row.
+        """
+        result = np.full((len(texts), self.num_perm), EMPTY_SIGNATURE_VALUE, dtype=np.uint32)
+        hashed = [(row, shingle_hashes(text)) for row, text in enumerate(texts)]
+        hashed = [(row, hashes) for row, hashes in hashed if hashes.size]
+
+        # Group documents into chunks so the per-chunk matrix stays bounded
+        start = 0
+        while start < len(hashed):
+            end = start
+            total = 0
+            while end < len(hashed) and (end == start or total + hashed[end][1].size <= MAX_CHUNK_SHINGLES):
+                total += hashed[end][1].size
+                end += 1
+
+            chunk = hashed[start:end]
+            values = np.concatenate([hashes for _, hashes in chunk])
+            offsets = np.cumsum([0] + [hashes.size for _, hashes in chunk[:-1]])
+
+            # (shingles, num_perm) permuted hashes, then min per document segment
+            permuted = (values[:, None] * self._a[None, :] + self._b[None, :]) >> np.uint64(32)
+            minima = np.minimum.reduceat(permuted, offsets, axis=0)
+            result[[row for row, _ in chunk]] = minima.astype(np.uint32)
+
+            start = end
+
+        return result
+
+
+class DuplicateIndex:
+    """
+    In-memory LSH index over MinHash signatures, optionally persisted to an
+    .npz file between runs. Each job gets a cluster ID: a new one if nothing
+    similar has been seen, otherwise the cluster of its closest match.
+    """
+
+    def __init__(
+            self,
+            num_perm: int = NUM_PERM,
+            bands: int = BANDS,
+            threshold: float = SIMILARITY_THRESHOLD,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+
+        self._signatures = np.empty((0, num_perm), dtype=np.uint32)
+        self._pending = []  # signatures added since the last stack into _signatures
+        self._urls: list[str] = []
+        self._cluster_ids: list[str] = []
+        self._duplicate_of: list[str] = []
+        self._url_rows: dict[str, int] = {}
+        self._buckets: list[dict[bytes, list[int]]] = [{} for _ in range(bands)]
+        self.stats = {"checked": 0, "duplicates": 0, "clusters": 0}
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def _signature(self, index: int) -> np.ndarray:
+        if index < len(self._signatures):
+            return self._signatures[index]
+        return self._pending[index - len(self._signatures)]
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def _best_match(self, signature: np.ndarray, keys: list[bytes]) -> tuple[int, float]:
+        candidates = set()
+        for band, key in enumerate(keys):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best, best_score = -1, 0.0
+        for candidate in candidates:
+            score = float(np.mean(self._signature(candidate) == signature))
+            if score > best_score:
+                best, best_score = candidate, score
+        return best, best_score
+
+    def _insert(
+            self, signature: np.ndarray, keys: list[bytes], url: str, cluster_id: str, duplicate_of: str
+    ) -> None:
+        index = len(self._urls)
+        self._pending.append(signature)
+        self._urls.append(url)
+        self._cluster_ids.append(cluster_id)
+        self._duplicate_of.append(duplicate_of)
+        self._url_rows[url] = index
+        for band, key in enumerate(keys):
+            self._buckets[band].setdefault(key, []).append(index)
+
+    def tag(self, jobs: list[dict], text_field: str = "Job Description") -> list[bool]:
+        """
+        Fingerprint a batch of jobs, add them to the index and tag each with
+        "Duplicate Cluster ID" / "Duplicate Of". Returns a parallel list of
+        is-duplicate flags.
+        """
+        texts = [job.get(text_field) for job in jobs]
+        usable = [i for i, text in enumerate(texts) if isinstance(text, str) and text != "Not Available"]
+        signatures = self.hasher.signatures([texts[i] for i in usable])
+
+        flags = [False] * len(jobs)
+        for row, job_index in enumerate(usable):
+            signature = signatures[row]
+            if signature[0] == EMPTY_SIGNATURE_VALUE and (signature == EMPTY_SIGNATURE_VALUE).all():
+                continue  # no words to fingerprint
+
+            job = jobs[job_index]
+            url = job.get("url", "")
+            self.stats["checked"] += 1
+
+            known = self._url_rows.get(url)
+            if known is not None:
+                # Same posting seen before (resume / re-scrape): keep its earlier verdict
+                job["Duplicate Cluster ID"] = self._cluster_ids[known]
+                job["Duplicate Of"] = self._duplicate_of[known]
+                flags[job_index] = self._duplicate_of[known] != "Not Available"
+                self.stats["duplicates"] += flags[job_index]
+                continue
+
+            keys = self._band_keys(signature)
+            match, score = self._best_match(signature, keys)
+            if match >= 0 and score >= self.threshold:
+                cluster_id = self._cluster_ids[match]
+                job["Duplicate Cluster ID"] = cluster_id
+                job["Duplicate Of"] = self._urls[match]
+                flags[job_index] = True
+                self.stats["duplicates"] += 1
+            else:
+                cluster_id = hashlib.sha1(url.encode("utf-8")).hexdigest()[:12]
+                job["Duplicate Cluster ID"] = cluster_id
+                job["Duplicate Of"] = "Not Available"
+                self.stats["clusters"] += 1
+
+            self._insert(signature, keys, url, cluster_id, job["Duplicate Of"])
+
+        return flags
+
+    def save(self, path: str) -> None:
+        if self._pending:
+            self._signatures = np.vstack([self._signatures, np.stack(self._pending)])
+            self._pending = []
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                signatures=self._signatures,
+                urls=np.array(self._urls, dtype=str),
+                cluster_ids=np.array(self._cluster_ids, dtype=str),
+                duplicate_of=np.array(self._duplicate_of, dtype=str),
+            )
+        logger.info("Dedup index saved | path=%s | jobs=%s", path, len(self))
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "DuplicateIndex":
+        index = cls(**kwargs)
+        if not Path(path).exists():
+            return index
+
+        with np.load(path) as data:
+            signatures = data["signatures"]
+            if signatures.shape[1] != index.hasher.num_perm:
+                raise ValueError(f"Dedup index {path} was built with {signatures.shape[1]} permutations")
+            index._signatures = signatures
+            index._urls = data["urls"].tolist()
+            index._cluster_ids = data["cluster_ids"].tolist()
+            index._duplicate_of = data["duplicate_of"].tolist()
+        index._url_rows = {url: row for row, url in enumerate(index._urls)}
+
+        for band in range(index.bands):
+            band_bytes = np.ascontiguousarray(signatures[:, band * index.rows:(band + 1) * index.rows])
+            buckets = index._buckets[band]
+            for row, key in enumerate(band_bytes.view(f"V{band_bytes.shape[1] * 4}").ravel()):
+                buckets.setdefault(key.tobytes(), []).append(row)
+
+        logger.info("Dedup index loaded | path=%s | jobs=%s", path, len(index))
+        return index
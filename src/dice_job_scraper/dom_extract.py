@@ -0,0 +1,216 @@
+"""
+In-page extraction: run one evaluate script per page type and get back only the
+fields the parsers need, instead of shipping `page.content()` over the
+Playwright pipe and re-parsing it with BeautifulSoup.
+
+The scripts mirror the BeautifulSoup lookups in job_details.py / parser.py
+(class substring matches, `.string` semantics, script/style text skipped), and
+classification stays in Python so both paths share one set of rules.
+"""
+import logging
+
+from .job_details import (
+    classify_badge_texts,
+    classify_overview_chips,
+    extract_company_from_title,
+    split_location_posted,
+)
+from .parser import total_pages_from_text
+
+logger = logging.getLogger(__name__)
+
+# Shared helpers, prepended to each page script.
+_DOM_HELPERS = r"""
+  const SKIPPED = new Set(["SCRIPT", "STYLE", "TEMPLATE"]);
+
+  // Element.get_text(separator, strip) from BeautifulSoup, which stores a
+  // whitespace-only string as "\n" (or " " without a newline) outside <pre>/<textarea>.
+  const getText = (el, separator = "", strip = false) => {
+    const parts = [];
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+      const node = walker.currentNode;
+      if (node.parentElement && SKIPPED.has(node.parentElement.tagName)) continue;
+      let text = node.nodeValue;
+      if (strip) {
+        text = text.trim();
+        if (!text) continue;
+      } else if (!text.trim() && !(node.parentElement && node.parentElement.closest("pre, textarea"))) {
+        text = text.includes("\n") ? "\n" : " ";
+      }
+      parts.push(text);
+    }
+    return parts.join(separator);
+  };
+
+  // Tag.string from BeautifulSoup: the single text descendant, or null.
+  const tagString = (el) => {
+    let node = el;
+    while (node.childNodes.length === 1) {
+      const child = node.childNodes[0];
+      if (child.nodeType === Node.TEXT_NODE) return child.nodeValue;
+      if (child.nodeType !== Node.ELEMENT_NODE) return null;
+      node = child;
+    }
+    return null;
+  };
+
+  // class_=lambda x: x and "fragment" in x
+  const classHas = (el, ...fragments) => {
+    const value = el.getAttribute("class") || "";
+    return fragments.every((fragment) => value.includes(fragment));
+  };
+
+  const findFirst = (root, selector, predicate) => {
+    for (const el of root.querySelectorAll(selector)) {
+      if (predicate(el)) return el;
+    }
+    return null;
+  };
+"""
+
+JOB_PAGE_SCRIPT = (
+    "() => {"
+    + _DOM_HELPERS
+    + r"""
+  const card = document.querySelector('div[data-testid="job-detail-header-card"]');
+  if (!card) return null;
+
+  const companyLink = card.querySelector("a[href]");
+  const h1 = card.querySelector("h1");
+  const meta = findFirst(card, "span", (el) => classHas(el, "text-font-light"));
+
+  const chips = [];
+  for (const container of document.querySelectorAll("div")) {
+    if (!classHas(container, "job-overview_detailContainer")) continue;
+    for (const chip of container.querySelectorAll("div")) {
+      if (classHas(chip, "chip_chip")) chips.push(getText(chip).trim());
+    }
+  }
+
+  let skills = [];
+  const skillsHeading = findFirst(document, "h3", (el) => (tagString(el) || "").includes("Skills"));
+  if (skillsHeading) {
+    let ul = skillsHeading.nextElementSibling;
+    while (ul && ul.tagName !== "UL") ul = ul.nextElementSibling;
+    if (ul) {
+      for (const li of ul.querySelectorAll("li")) {
+        const div = findFirst(li, "div", (el) => classHas(el, "font-medium"));
+        if (div) skills.push(getText(div).trim());
+      }
+    }
+  }
+
+  const description = findFirst(document, "div", (el) => classHas(el, "job-detail-description-module"));
+
+  let recruiter = null;
+  const recruiterBox = findFirst(document, "div", (el) => classHas(el, "rounded-3xl", "flex-1"));
+  if (recruiterBox) {
+    const name = recruiterBox.querySelector("h4");
+    const title = findFirst(recruiterBox, "span", (el) => classHas(el, "text-sm"));
+    const profile = findFirst(recruiterBox, "a[href]", (el) => (tagString(el) || "").includes("View Profile"));
+    recruiter = {
+      name: name ? getText(name, "", true) : null,
+      title: title ? getText(title, "", true) : null,
+      profile: profile ? profile.getAttribute("href") : null,
+    };
+  }
+
+  return {
+    companyName: companyLink ? getText(companyLink, "", true) : null,
+    companyLink: companyLink ? companyLink.getAttribute("href") : null,
+    title: h1 ? getText(h1, "", true) : null,
+    meta: meta ? getText(meta, "", true) : null,
+    badges: [...card.querySelectorAll("div.SeuiInfoBadge")].map((el) => getText(el, "", true)),
+    chips,
+    skills,
+    description: description ? getText(description, "\n").trim() : null,
+    recruiter,
+  };
+}"""
+)
+
+LIST_PAGE_SCRIPT = (
+    "(limit) => {"
+    + _DOM_HELPERS
+    + r"""
+  const pagination = findFirst(document, "section[aria-label]", (el) => el.getAttribute("aria-label").includes("Page"));
+
+  const cards = [...document.querySelectorAll('div[role="listitem"]')].slice(0, limit);
+  const jobs = cards.map((card) => {
+    const title = card.querySelector('a[data-testid="job-search-job-detail-link"]');
+    const company = card.querySelector("p.text-sm");
+    const location = findFirst(card, "p", (el) => (tagString(el) || "").includes(","));
+    return {
+      title: title ? getText(title).trim() : "N/A",
+      company: company ? getText(company).trim() : "N/A",
+      location: location ? getText(location).trim() : "N/A",
+      url: title ? title.getAttribute("href") : "N/A",
+    };
+  });
+
+  return {
+    pagination: pagination ? getText(pagination, "", true) : null,
+    jobs,
+  };
+}"""
+)
+
+
+def build_job_data(raw: dict | None) -> dict:
+    """Turn the JOB_PAGE_SCRIPT payload into the same dict parse_job_page returns."""
+    if raw is None:
+        return {"error": "No job header card found"}
+
+    job_data = {
+        "Company Name": raw["companyName"] if raw["companyName"] is not None else "Not Available",
+        "Company Link": raw["companyLink"] if raw["companyLink"] is not None else "Not Available",
+        "Job Title": raw["title"] if raw["title"] is not None else "Not Available",
+    }
+
+    if raw["meta"] is None:
+        job_data.update({"Location": "Not Available", "Posted Date": "Not Available"})
+    else:
+        job_data.update(split_location_posted(raw["meta"]))
+
+    job_data.update(classify_badge_texts(raw["badges"]))
+    job_data.update(classify_overview_chips(raw["chips"]))
+    job_data["Primary Skill Set"] = raw["skills"]
+    job_data["Job Description"] = (
+        raw["description"] if raw["description"] is not None else "Not Available"
+    )
+
+    recruiter = raw["recruiter"]
+    if recruiter is None:
+        job_data.update({
+            "Recruiter Name": "Not Available",
+            "Recruiter Title": "Not Available",
+            "Recruiter Company": "Not Available",
+            "Recruiter Profile Link": "Not Available"
+        })
+    else:
+        recruiter_title = recruiter["title"] if recruiter["title"] is not None else "Not Available"
+        job_data.update({
+            "Recruiter Name": recruiter["name"] if recruiter["name"] is not None else "Not Available",
+            "Recruiter Title": recruiter_title,
+            "Recruiter Company": extract_company_from_title(recruiter_title),
+            "Recruiter Profile Link": recruiter["profile"] if recruiter["profile"] is not None else "Not Available",
+        })
+
+    return job_data
+
+
+def build_list_data(raw: dict) -> tuple[int, list[dict]]:
+    """Turn the LIST_PAGE_SCRIPT payload into (total_pages, jobs) like the HTML parser."""
+    total_pages = total_pages_from_text(raw["pagination"]) if raw["pagination"] is not None else 1
+    return total_pages, raw["jobs"]
+
+
+async def extract_job_page(page) -> dict:
+    """Extract job details from the rendered detail page without serializing the DOM."""
+    return build_job_data(await page.evaluate(JOB_PAGE_SCRIPT))
+
+
+async def extract_list_page(page, limit: int) -> tuple[int, list[dict]]:
+    """Extract total pages and job cards from the rendered search results page."""
+    return build_list_data(await page.evaluate(LIST_PAGE_SCRIPT, limit))
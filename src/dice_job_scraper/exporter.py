@@ -7,6 +7,8 @@ import json
 from pathlib import Path
 import logging
 
+from .models import JobRecord
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,7 +17,7 @@ def generate_timestamped_filename(prefix: str, suffix: str) -> str:
     return f"{prefix}_{timestamp}.{suffix}"
 
 
-def write_jobs_to_csv(jobs: list[dict], output_dir: str, prefix="dice_jobs"):
+def write_jobs_to_csv(jobs: list[dict | JobRecord], output_dir: str, prefix="dice_jobs"):
     if not jobs:
         logger.warning("No jobs to write to CSV")
         return None
@@ -27,9 +29,13 @@ def write_jobs_to_csv(jobs: list[dict], output_dir: str, prefix="dice_jobs"):
     full_path = output_path / filename
 
     with full_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=jobs[0].keys())
+        # Union of keys in first-seen order: jobs without details (failed or
+        # retried later) can come first and carry fewer columns.
+        fieldnames = list(dict.fromkeys(key for job in jobs for key in job.keys()))
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-        writer.writerows(jobs)
+        # Records are expanded to dicts one row at a time, never all at once
+        writer.writerows(job.to_dict() if isinstance(job, JobRecord) else job for job in jobs)
 
     logger.info("CSV written", extra={"path": str(full_path), "jobs": len(jobs)})
     return full_path
@@ -68,4 +74,16 @@ async def write_jobs_to_jsonl_async(
         },
     )
 
-    return jsonl_path
\ No newline at end of file
+    return jsonl_path
+
+
+def write_run_summary(summary: dict, output_dir: str, prefix="run_summary"):
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    full_path = output_path / generate_timestamped_filename(prefix, "json")
+    with full_path.open("w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+
+    logger.info("Run summary written | path=%s", full_path)
+    return full_path
@@ -125,7 +125,11 @@ def extract_location_posted(header_card) -> dict:
     if not location_span:
         return {"Location": "Not Available", "Posted Date": "Not Available"}
 
-    span_text = location_span.get_text(strip=True)
+    return split_location_posted(location_span.get_text(strip=True))
+
+
+def split_location_posted(span_text: str) -> dict:
+    """Split 'City, ST • Posted 3 days ago' into location and posted date."""
     parts = [part.strip() for part in span_text.split("•")]
 
     return {
@@ -141,15 +145,17 @@ def classify_all_badges(header_card) -> dict:
     Returns: Position Types, Work Arrangement, Pay Information, Other Badges
     """
     all_badges = header_card.find_all("div", class_="SeuiInfoBadge")
+    return classify_badge_texts([badge.get_text(strip=True) for badge in all_badges])
+
 
+def classify_badge_texts(badge_texts: list[str]) -> dict:
+    """Classify already-extracted badge texts (shared by the HTML and DOM paths)."""
     position_types = []
     work_arrangement = []
     pay_info = []
     other_badges = []
 
-    for badge in all_badges:
-        badge_text = badge.get_text(strip=True)
-
+    for badge_text in badge_texts:
         # Position Type classification
         if is_position_type(badge_text):
             position_types.append(badge_text)
@@ -191,21 +197,60 @@ def is_pay_info(badge_text: str) -> bool:
     return "$" in badge_text or any(keyword in badge_text.lower() for keyword in ["hr", "hour", "pay", "rate"])
 
 
-def get_job_overview(soup):
-    details = {}
+# Filterable badge flags: name -> keywords looked up in the badge/arrangement fields.
+BADGE_FLAGS = {
+    "remote": ("remote",),
+    "hybrid": ("hybrid",),
+    "onsite": ("on-site", "onsite", "on site"),
+    "contract": ("contract",),
+    "c2c": ("c2c", "corp to corp", "corp-to-corp"),
+    "w2": ("w2",),
+    "c2h": ("c2h", "contract to hire", "contract-to-hire"),
+    "fulltime": ("full-time", "full time", "fulltime"),
+}
+BADGE_SOURCE_FIELDS = ("Position Types", "Work Arrangement", "Employment Type", "Other Badges")
+
+
+def badge_flags(job: dict) -> int:
+    """Bitmask of BADGE_FLAGS present in the job's badge fields."""
+    values = []
+    for field in BADGE_SOURCE_FIELDS:
+        value = job.get(field)
+        if isinstance(value, list):
+            values.extend(value)
+        elif isinstance(value, str):
+            values.append(value)
+    text = " ".join(values).lower()
+
+    mask = 0
+    for bit, keywords in enumerate(BADGE_FLAGS.values()):
+        if any(keyword in text for keyword in keywords):
+            mask |= 1 << bit
+    return mask
+
+
+def flags_mask(names: list[str]) -> int:
+    names_to_bit = {name: bit for bit, name in enumerate(BADGE_FLAGS)}
+    mask = 0
+    for name in names:
+        if name not in names_to_bit:
+            raise ValueError(f"Unknown badge filter {name!r}; choose from {', '.join(BADGE_FLAGS)}")
+        mask |= 1 << names_to_bit[name]
+    return mask
+
+
+def flag_names(mask: int) -> list[str]:
+    """BADGE_FLAGS names set in mask (inverse of flags_mask)."""
+    return [name for bit, name in enumerate(BADGE_FLAGS) if mask >> bit & 1]
 
+
+def get_job_overview(soup):
     # --- Employment / Pay / Work Arrangement / Travel ---
+    chip_texts = []
     for container in soup.find_all("div", class_=lambda x: x and "job-overview_detailContainer" in x):
         for chip in container.find_all("div", class_=lambda x: x and "chip_chip" in x):
-            text = chip.text.strip()
-            if "Contract" in text:
-                details["Employment Type"] = text
-            elif "$" in text:
-                details["Pay"] = text
-            elif "Hybrid" in text or "days" in text:
-                details["Work Arrangement"] = text
-            elif "Travel" in text:
-                details["Travel Requirements"] = text
+            chip_texts.append(chip.text.strip())
+    details = classify_overview_chips(chip_texts)
 
     # --- Skills ---
     skills = []
@@ -230,6 +275,21 @@ def get_job_overview(soup):
     return details
 
 
+def classify_overview_chips(chip_texts: list[str]) -> dict:
+    """Map job overview chip texts onto Employment Type / Pay / Work Arrangement / Travel."""
+    details = {}
+    for text in chip_texts:
+        if "Contract" in text:
+            details["Employment Type"] = text
+        elif "$" in text:
+            details["Pay"] = text
+        elif "Hybrid" in text or "days" in text:
+            details["Work Arrangement"] = text
+        elif "Travel" in text:
+            details["Travel Requirements"] = text
+    return details
+
+
 def recruiter_details(soup) -> dict:
     """
     Extract recruiter information from the new Dice recruiter section.
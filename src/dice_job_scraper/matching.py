@@ -0,0 +1,447 @@
+"""
+Offline resume-to-job matching.
+
+Jobs are embedded with a signed hashing-trick TF vector (no vocabulary, no
+network model) over their title, description and skills, L2-normalized and
+stored sparsely in memory-mapped arrays that grow as jobs are scraped. IDF
+comes from per-bucket document frequencies and is applied to the query side
+only, so adding jobs never rewrites other rows.
+
+Speed/quality tradeoff: the hash space is 2**18 buckets, so distinct terms
+rarely collide and IDF separates common from rare terms. A ~350-token
+description has ~200 non-zero buckets. Each is stored twice, row-major in
+an append-only log and bucket-major as postings (int32 row/bucket + float16
+weight each, ~2.5-3 KB per job with the postings' slack), so a query reads
+only the postings of its own buckets rather than every stored entry.
+"""
+import json
+import logging
+import re
+import shutil
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+from .job_details import badge_flags, flags_mask
+
+logger = logging.getLogger(__name__)
+
+DIM = 1 << 18
+FORMAT_VERSION = 3
+INITIAL_CAPACITY = 4096  # rows; entries and postings start at INITIAL_CAPACITY * ENTRIES_PER_ROW
+ENTRIES_PER_ROW = 128
+POSTING_BLOCK = 8  # postings in a bucket's first block; each further block doubles
+POSTING_LEVELS = 26  # blocks per bucket, so up to POSTING_BLOCK * 2**26 postings
+GARBAGE_SHARE = 0.25  # compact once overwritten entries pass this share of all entries
+COMPACT_ROWS = 1 << 14
+SKILL_WEIGHT = 2  # skills are counted this many times on top of the description
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it of on or our that the this to "
+    "we will with you your years year experience work working".split()
+)
+
+META_FIELDS = {"url": "url", "title": "Job Title", "company": "Company Name", "location": "Location"}
+
+
+def tokenize(text: str) -> list[str]:
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+def job_text(job: dict) -> str:
+    description = job.get("Job Description")
+    if not isinstance(description, str) or description == "Not Available":
+        description = ""
+    skills = job.get("Primary Skill Set")
+    skills_text = " ".join(skills) if isinstance(skills, list) else ""
+    title = job.get("Job Title") or job.get("title") or ""
+    return " ".join([title, description] + [skills_text] * SKILL_WEIGHT)
+
+
+def vectorize(texts: list[str], dim: int = DIM) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Signed hashing-trick vectors with sublinear TF, L2-normalized, in CSR
+    form (indptr, indices, values): row i's buckets and weights are
+    indices[indptr[i]:indptr[i + 1]] and values[indptr[i]:indptr[i + 1]].
+    """
+    rows, hashes = [], []
+    for row, text in enumerate(texts):
+        for token in tokenize(text):
+            rows.append(row)
+            hashes.append(zlib.crc32(token.encode("utf-8")))
+
+    indptr = np.zeros(len(texts) + 1, dtype=np.int64)
+    if not hashes:
+        return indptr, np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+
+    hashes = np.array(hashes, dtype=np.uint32)
+    signs = np.where(hashes & np.uint32(1 << 31), -1.0, 1.0)
+    keys = np.array(rows, dtype=np.int64) * dim + (hashes % dim)
+
+    # Sorted unique (row, bucket) keys keep each row's entries contiguous
+    keys, inverse = np.unique(keys, return_inverse=True)
+    counts = np.bincount(inverse, weights=signs, minlength=len(keys))
+    nonzero = counts != 0
+    keys, counts = keys[nonzero], counts[nonzero]
+
+    entry_rows = keys // dim
+    weights = np.sign(counts) * np.log1p(np.abs(counts))
+    norms = np.sqrt(np.bincount(entry_rows, weights=weights ** 2, minlength=len(texts)))
+    indptr[1:] = np.cumsum(np.bincount(entry_rows, minlength=len(texts)))
+    return indptr, (keys % dim).astype(np.int32), (weights / norms[entry_rows]).astype(np.float32)
+
+
+
+
+class MatchIndex:
+    """
+    On-disk sparse job vector index in a directory.
+
+    Row-major entry log, appended to as jobs are added:
+      indices.i32      memmap (entry_capacity,) bucket of each logged entry
+      values.f16       memmap (entry_capacity,) weight of each logged entry
+      starts.i64       memmap (capacity,) first entry of each row
+      lengths.i32      memmap (capacity,) number of entries of each row
+      flags.u32        memmap (capacity,) BADGE_FLAGS bitmask per row
+      offsets.i64      memmap (capacity,) byte offset of each row's meta line, -1 once overwritten
+      df.i64           memmap (dim,) per-bucket document frequencies of live rows
+    Bucket-major postings, what queries read:
+      post_rows.i32    memmap (post_capacity,) row of each posting
+      post_values.f16  memmap (post_capacity,) weight of each posting
+      post_blocks.i32  memmap (dim, POSTING_LEVELS) start of each bucket's blocks, in POSTING_BLOCK units
+      post_counts.i64  memmap (dim,) postings per bucket
+      meta.jsonl       url/title/company/location per row
+      state.json       format, dim, row/entry/posting counts and capacities
+
+    A bucket's postings live in a chain of blocks of POSTING_BLOCK,
+    2 * POSTING_BLOCK, 4 * POSTING_BLOCK ... postings, allocated at the end
+    of the postings files as the bucket fills, so appends never move
+    existing postings and a bucket is read in a handful of slices.
+
+    Rows are keyed by URL: re-adding a known URL appends a new row and marks
+    the old one dead (offset -1); its entries and postings stay behind as
+    garbage until compact() rebuilds the index from the live rows, which
+    add_jobs does once garbage passes GARBAGE_SHARE of the logged entries.
+    """
+
+    _ARRAYS = (
+        "indices", "values", "starts", "lengths", "flags", "offsets", "df",
+        "post_rows", "post_values", "post_blocks", "post_counts",
+    )
+
+    def __init__(self, path: str, dim: int = DIM):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._url_rows = None  # url -> row, loaded on first add_jobs
+
+        state_path = self.path / "state.json"
+        if state_path.exists():
+            self._load_state(json.loads(state_path.read_text(encoding="utf-8")))
+        else:
+            self.dim = dim
+            self.count = self.capacity = self.dead = 0
+            self.entries = self.entry_capacity = self.garbage = 0
+            self.postings = self.post_capacity = 0
+            for name, size in (("df.i64", 8 * dim), ("post_counts.i64", 8 * dim),
+                               ("post_blocks.i32", 4 * dim * POSTING_LEVELS)):
+                with open(self.path / name, "wb") as f:
+                    f.truncate(size)
+            initial_entries = INITIAL_CAPACITY * ENTRIES_PER_ROW
+            self._resize(INITIAL_CAPACITY, initial_entries, initial_entries)
+            self._save_state()
+
+        self._open()
+
+    def __len__(self) -> int:
+        return self.count - self.dead
+
+    def _open(self) -> None:
+        def memmap(name, dtype, *shape):
+            return np.memmap(self.path / name, dtype=dtype, mode="r+", shape=shape)
+
+        self.indices = memmap("indices.i32", np.int32, self.entry_capacity)
+        self.values = memmap("values.f16", np.float16, self.entry_capacity)
+        self.starts = memmap("starts.i64", np.int64, self.capacity)
+        self.lengths = memmap("lengths.i32", np.int32, self.capacity)
+        self.flags = memmap("flags.u32", np.uint32, self.capacity)
+        self.offsets = memmap("offsets.i64", np.int64, self.capacity)
+        self.df = memmap("df.i64", np.int64, self.dim)
+        self.post_rows = memmap("post_rows.i32", np.int32, self.post_capacity)
+        self.post_values = memmap("post_values.f16", np.float16, self.post_capacity)
+        self.post_blocks = memmap("post_blocks.i32", np.int32, self.dim, POSTING_LEVELS)
+        self.post_counts = memmap("post_counts.i64", np.int64, self.dim)
+
+    def _close(self) -> None:
+        for name in self._ARRAYS:
+            getattr(self, name).flush()
+            delattr(self, name)
+
+    def _flush(self) -> None:
+        for name in self._ARRAYS:
+            getattr(self, name).flush()
+
+    def _resize(self, capacity: int, entry_capacity: int, post_capacity: int) -> None:
+        files = (
+            ("starts.i64", 8, capacity), ("lengths.i32", 4, capacity), ("flags.u32", 4, capacity),
+            ("offsets.i64", 8, capacity), ("indices.i32", 4, entry_capacity), ("values.f16", 2, entry_capacity),
+            ("post_rows.i32", 4, post_capacity), ("post_values.f16", 2, post_capacity),
+        )
+        for name, item_bytes, items in files:
+            with open(self.path / name, "ab") as f:
+                f.truncate(items * item_bytes)
+        self.capacity = capacity
+        self.entry_capacity = entry_capacity
+        self.post_capacity = post_capacity
+
+    def _reserve(self, rows: int, entries: int, postings: int) -> None:
+        """Grow (doubling) so that rows rows, entries entries and postings postings fit."""
+        if rows <= self.capacity and entries <= self.entry_capacity and postings <= self.post_capacity:
+            return
+        self._close()
+        self._resize(
+            max(rows, self.capacity * 2) if rows > self.capacity else self.capacity,
+            max(entries, self.entry_capacity * 2) if entries > self.entry_capacity else self.entry_capacity,
+            max(postings, self.post_capacity * 2) if postings > self.post_capacity else self.post_capacity,
+        )
+        self._open()
+
+    def _load_state(self, state: dict) -> None:
+        self.dim = state["dim"]
+        self.count = state["count"]
+        self.capacity = state["capacity"]
+        self.dead = state["dead"]
+        self.entries = state["entries"]
+        self.entry_capacity = state["entry_capacity"]
+        self.garbage = state["garbage"]
+        self.postings = state["postings"]
+        self.post_capacity = state["post_capacity"]
+
+    def _save_state(self) -> None:
+        state = {
+            "format": FORMAT_VERSION,
+            "dim": self.dim,
+            "count": self.count,
+            "capacity": self.capacity,
+            "dead": self.dead,
+            "entries": self.entries,
+            "entry_capacity": self.entry_capacity,
+            "garbage": self.garbage,
+            "postings": self.postings,
+            "post_capacity": self.post_capacity,
+        }
+        tmp_path = self.path / "state.json.tmp"
+        tmp_path.write_text(json.dumps(state), encoding="utf-8")
+        tmp_path.replace(self.path / "state.json")
+
+    def _load_url_rows(self) -> dict[str, int]:
+        # meta.jsonl also holds lines of overwritten rows; only live offsets count
+        if self.count == 0:
+            return {}
+        offset_rows = {int(offset): row for row, offset in enumerate(self.offsets[:self.count]) if offset >= 0}
+        url_rows = {}
+        with open(self.path / "meta.jsonl", "rb") as f:
+            offset = 0
+            for line in f:
+                row = offset_rows.get(offset)
+                if row is not None:
+                    url_rows[json.loads(line)["url"]] = row
+                offset += len(line)
+        return url_rows
+
+    def _entry_positions(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Log positions of the entries of rows, and the row of each position."""
+        lengths = self.lengths[rows].astype(np.int64)
+        firsts = np.cumsum(lengths) - lengths
+        positions = np.arange(int(lengths.sum())) + np.repeat(self.starts[rows] - firsts, lengths)
+        return np.repeat(rows, lengths), positions
+
+    def _bucket_blocks(self, bucket: int):
+        """(start, size) of the filled part of each of bucket's posting blocks."""
+        remaining = int(self.post_counts[bucket])
+        for level in range(POSTING_LEVELS):
+            if remaining <= 0:
+                return
+            size = min(POSTING_BLOCK << level, remaining)
+            yield int(self.post_blocks[bucket, level]) * POSTING_BLOCK, size
+            remaining -= size
+
+    def _append_postings(self, buckets: np.ndarray, rows: np.ndarray, values: np.ndarray) -> None:
+        order = np.argsort(buckets, kind="stable")
+        buckets, rows, values = buckets[order], rows[order], values[order]
+
+        # Rank of each posting in its bucket -> block level and slot within the block
+        ranks = self.post_counts[buckets] + np.arange(len(buckets)) - np.searchsorted(buckets, buckets)
+        levels = np.frexp(ranks // POSTING_BLOCK + 1)[1] - 1
+        slots = ranks - POSTING_BLOCK * ((1 << levels) - 1)
+        if len(levels) and levels.max() >= POSTING_LEVELS:
+            raise ValueError(f"Match index {self.path} bucket exceeds {POSTING_LEVELS} posting blocks")
+
+        # The first posting of a level allocates that bucket's block
+        opens = slots == 0
+        sizes = POSTING_BLOCK << levels[opens]
+        block_starts = self.postings + np.cumsum(sizes) - sizes
+        self._reserve(self.count, self.entries, self.postings + int(sizes.sum()))
+        self.post_blocks[buckets[opens], levels[opens]] = block_starts // POSTING_BLOCK
+        self.postings += int(sizes.sum())
+
+        positions = self.post_blocks[buckets, levels].astype(np.int64) * POSTING_BLOCK + slots
+        self.post_rows[positions] = rows
+        self.post_values[positions] = values
+        self.post_counts[:] += np.bincount(buckets, minlength=self.dim)
+
+    def add_jobs(self, jobs: list[dict]) -> int:
+        """Add or update a batch of jobs by URL; arrays double in capacity when full."""
+        # Last occurrence of a URL in the batch wins
+        jobs = list({job["url"]: job for job in jobs if job.get("url") not in (None, "N/A")}.values())
+        if not jobs:
+            return 0
+        metas = [{key: job.get(field) for key, field in META_FIELDS.items()} for job in jobs]
+        flags = [badge_flags(job) for job in jobs]
+        added = self.add_vectors(metas, flags, *vectorize([job_text(job) for job in jobs], self.dim))
+        if self.garbage > GARBAGE_SHARE * self.entries:
+            self.compact()
+        return added
+
+    def add_vectors(
+            self,
+            metas: list[dict],
+            flags: list[int] | np.ndarray,
+            indptr: np.ndarray,
+            indices: np.ndarray,
+            values: np.ndarray,
+    ) -> int:
+        """Add rows given as vectorize() output, one per meta; metas' URLs must be distinct."""
+        if self._url_rows is None:
+            self._url_rows = self._load_url_rows()
+
+        rows = self.count + np.arange(len(metas))
+        self._reserve(self.count + len(metas), self.entries + len(indices), self.postings)
+
+        # Overwritten rows die; their entries and postings are garbage until compact()
+        for meta, row in zip(metas, rows):
+            old = self._url_rows.get(meta["url"])
+            self._url_rows[meta["url"]] = int(row)
+            if old is not None:
+                start, length = int(self.starts[old]), int(self.lengths[old])
+                np.subtract.at(self.df, self.indices[start:start + length], 1)
+                self.offsets[old] = -1
+                self.dead += 1
+                self.garbage += length
+
+        lengths = np.diff(indptr)
+        base = self.entries
+        self.indices[base:base + len(indices)] = indices
+        self.values[base:base + len(values)] = values
+        self.starts[rows] = base + indptr[:-1]
+        self.lengths[rows] = lengths
+        self.df[:] += np.bincount(indices, minlength=self.dim)
+        self.flags[rows] = flags
+        self._append_postings(np.asarray(indices), np.repeat(rows, lengths).astype(np.int32), np.asarray(values))
+
+        with open(self.path / "meta.jsonl", "ab") as f:
+            offset = f.tell()
+            for row, meta in zip(rows, metas):
+                line = json.dumps(meta, ensure_ascii=False).encode("utf-8") + b"\n"
+                self.offsets[row] = offset
+                f.write(line)
+                offset += len(line)
+
+        self.entries += len(indices)
+        self.count += len(metas)
+        self._flush()
+        self._save_state()
+        return len(metas)
+
+    def compact(self) -> None:
+        """Rebuild the index from its live rows, dropping overwritten rows' entries, postings and meta."""
+        if self.dead == 0:
+            return
+        tmp_path = self.path / "compact.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        rebuilt = MatchIndex(str(tmp_path), self.dim)
+        rebuilt._url_rows = {}
+
+        live = np.flatnonzero(self.offsets[:self.count] >= 0)
+        with open(self.path / "meta.jsonl", "rb") as f:
+            for first in range(0, len(live), COMPACT_ROWS):
+                rows = live[first:first + COMPACT_ROWS]
+                metas = []
+                for row in rows:
+                    f.seek(int(self.offsets[row]))
+                    metas.append(json.loads(f.readline()))
+                _, positions = self._entry_positions(rows)
+                indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+                indptr[1:] = np.cumsum(self.lengths[rows])
+                rebuilt.add_vectors(metas, self.flags[rows], indptr, self.indices[positions], self.values[positions])
+
+        dropped = self.garbage
+        rebuilt._close()
+        self._close()
+        # state.json goes last: until it is replaced the old state still describes the old files
+        for name in sorted(p.name for p in tmp_path.iterdir()):
+            if name != "state.json":
+                (tmp_path / name).replace(self.path / name)
+        (tmp_path / "state.json").replace(self.path / "state.json")
+        tmp_path.rmdir()
+
+        self._load_state(json.loads((self.path / "state.json").read_text(encoding="utf-8")))
+        self._url_rows = rebuilt._url_rows
+        self._open()
+        logger.info("Match index compacted | path=%s | rows=%s | entries_dropped=%s", self.path, self.count, dropped)
+
+    def query_vector(self, text: str) -> np.ndarray:
+        """Dense IDF-weighted, L2-normalized query over all dim buckets."""
+        indptr, indices, values = vectorize([text], self.dim)
+        idf = np.log((1 + len(self)) / (1 + self.df[indices])) + 1.0
+        vector = np.zeros(self.dim, dtype=np.float32)
+        vector[indices] = values * idf
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def scores(self, query: np.ndarray) -> np.ndarray:
+        """Dot product of query with every row, read from the postings of the query's buckets."""
+        scores = np.zeros(self.count, dtype=np.float32)
+        for bucket in np.flatnonzero(query):
+            weight = query[bucket]
+            # A row has at most one posting per bucket, so the scatter-add has no repeated rows
+            for start, size in self._bucket_blocks(bucket):
+                scores[self.post_rows[start:start + size]] += self.post_values[start:start + size].astype(np.float32) * weight
+        return scores
+
+    def search(
+            self,
+            text: str,
+            top: int = 50,
+            require: list[str] | None = None,
+            exclude: list[str] | None = None,
+    ) -> list[dict]:
+        """Top jobs by cosine-style score against text, filtered on badge flags."""
+        if len(self) == 0:
+            return []
+
+        scores = self.scores(self.query_vector(text))
+        required = np.uint32(flags_mask(require or []))
+        excluded = np.uint32(flags_mask(exclude or []))
+
+        allowed = self.offsets[:self.count] >= 0
+        if required or excluded:
+            flags = self.flags[:self.count]
+            allowed &= ((flags & required) == required) & ((flags & excluded) == 0)
+        scores[~allowed] = -np.inf
+
+        k = min(top, len(self))
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        candidates = candidates[np.argsort(-scores[candidates])]
+
+        results = []
+        with open(self.path / "meta.jsonl", "rb") as f:
+            for row in candidates:
+                if not np.isfinite(scores[row]):
+                    break
+                f.seek(int(self.offsets[row]))
+                meta = json.loads(f.readline())
+                meta["score"] = round(float(scores[row]), 4)
+                results.append(meta)
+        return results
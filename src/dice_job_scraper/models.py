@@ -0,0 +1,173 @@
+"""
+Compact typed job record.
+
+Scraped jobs are produced and exported as plain dicts; JobRecord is what the
+scraper keeps in memory for the whole run. Use JobRecord.from_dict at the
+boundary and JobRecord.to_dict (or write_jobs_to_csv directly) on the way out.
+"""
+import sys
+from dataclasses import dataclass
+
+
+class _Missing:
+    """Sentinel for a field the page did not provide ("Not Available" / "N/A" in the dict schema)."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __reduce__(self):
+        return (_Missing, ())
+
+
+MISSING = _Missing()
+
+# Missing-value strings used by the list page parser vs the detail page parser.
+LIST_MISSING = "N/A"
+DETAIL_MISSING = "Not Available"
+MISSING_STRINGS = (LIST_MISSING, DETAIL_MISSING)
+
+# Field types. None: key absent from the source dict. MISSING: key present
+# with a missing-value string. Label lists (badges, skills) are tuples.
+Text = str | _Missing | None
+Labels = tuple[str, ...] | str | _Missing | None
+
+# Distinct source key orders, shared between records (a handful per run).
+_KEY_ORDERS: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """
+    Compact in-memory form of a scraped job.
+
+    Slots instead of a per-job dict, interned strings for the highly repeated
+    categorical values, tuples for skill/badge lists and MISSING instead of
+    "Not Available"/"N/A". A field left as None means the key was absent from
+    the source dict; with the shared key_order tuple, from_dict/to_dict
+    round-trip the current schema exactly, key order included.
+    """
+
+    # List page (parser.extract_jobs)
+    title: Text = None
+    company: Text = None
+    location: Text = None
+    url: Text = None
+    # Detail page (job_details.parse_job_page)
+    company_name: Text = None
+    company_link: Text = None
+    job_title: Text = None
+    job_location: Text = None
+    posted_date: Text = None
+    position_types: Labels = None
+    work_arrangement: Labels = None
+    pay_information: Labels = None
+    other_badges: Labels = None
+    employment_type: Text = None
+    pay: Text = None
+    travel_requirements: Text = None
+    primary_skill_set: Labels = None
+    job_description: Text = None
+    recruiter_name: Text = None
+    recruiter_title: Text = None
+    recruiter_company: Text = None
+    recruiter_profile_link: Text = None
+    error: Text = None
+    # Dedup stage (dedup.DuplicateIndex.tag)
+    duplicate_cluster_id: Text = None
+    duplicate_of: Text = None
+    # Keys this model does not know about, kept so nothing is lost
+    extra: dict | None = None
+    # Source dict key order (shared tuple), so to_dict reproduces it
+    key_order: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, job: dict) -> "JobRecord":
+        record = cls()
+        extra = None
+        for key, value in job.items():
+            spec = _KEY_SPECS.get(key)
+            if spec is None:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+                continue
+            attr, _, intern = spec
+            setattr(record, attr, _compact(value, intern))
+        record.extra = extra
+        key_order = tuple(job)
+        record.key_order = _KEY_ORDERS.setdefault(key_order, key_order)
+        return record
+
+    def keys(self) -> tuple[str, ...]:
+        """Dict-schema keys this record will produce: source order, else schema order."""
+        if self.key_order:
+            return self.key_order
+        keys = tuple(key for key, (attr, _, _) in _KEY_SPECS.items() if getattr(self, attr) is not None)
+        return keys + tuple(self.extra or ())
+
+    def to_dict(self) -> dict:
+        job = {}
+        for key in self.keys():
+            spec = _KEY_SPECS.get(key)
+            if spec is None:
+                job[key] = self.extra[key]
+                continue
+            attr, missing, _ = spec
+            value = getattr(self, attr)
+            if value is MISSING:
+                job[key] = missing
+            elif isinstance(value, tuple):
+                job[key] = list(value)
+            else:
+                job[key] = value
+        return job
+
+
+def _compact(value, intern: bool):
+    if isinstance(value, str):
+        if value in MISSING_STRINGS:
+            return MISSING
+        return sys.intern(value) if intern else value
+    if isinstance(value, list):
+        return tuple(sys.intern(item) if intern and isinstance(item, str) else item for item in value)
+    return value
+
+
+# dict key -> (attribute, missing-value string, intern values?)
+_KEY_SPECS = {
+    "title": ("title", LIST_MISSING, True),
+    "company": ("company", LIST_MISSING, True),
+    "location": ("location", LIST_MISSING, True),
+    "url": ("url", LIST_MISSING, False),
+    "Company Name": ("company_name", DETAIL_MISSING, True),
+    "Company Link": ("company_link", DETAIL_MISSING, True),
+    "Job Title": ("job_title", DETAIL_MISSING, True),
+    "Location": ("job_location", DETAIL_MISSING, True),
+    "Posted Date": ("posted_date", DETAIL_MISSING, True),
+    "Position Types": ("position_types", DETAIL_MISSING, True),
+    "Work Arrangement": ("work_arrangement", DETAIL_MISSING, True),
+    "Pay Information": ("pay_information", DETAIL_MISSING, True),
+    "Other Badges": ("other_badges", DETAIL_MISSING, True),
+    "Employment Type": ("employment_type", DETAIL_MISSING, True),
+    "Pay": ("pay", DETAIL_MISSING, True),
+    "Travel Requirements": ("travel_requirements", DETAIL_MISSING, True),
+    "Primary Skill Set": ("primary_skill_set", DETAIL_MISSING, True),
+    "Job Description": ("job_description", DETAIL_MISSING, False),
+    "Recruiter Name": ("recruiter_name", DETAIL_MISSING, True),
+    "Recruiter Title": ("recruiter_title", DETAIL_MISSING, True),
+    "Recruiter Company": ("recruiter_company", DETAIL_MISSING, True),
+    "Recruiter Profile Link": ("recruiter_profile_link", DETAIL_MISSING, False),
+    "error": ("error", DETAIL_MISSING, True),
+    "Duplicate Cluster ID": ("duplicate_cluster_id", DETAIL_MISSING, True),
+    "Duplicate Of": ("duplicate_of", DETAIL_MISSING, False),
+}
@@ -0,0 +1,218 @@
+"""
+Batch normalization of the free-text pay and posted-date fields.
+
+Each function takes a whole column (list of raw values) and returns NumPy
+arrays: one compiled regex pass per value extracts the pieces, then number
+parsing, unit conversion and date arithmetic run as array operations over
+the batch rather than per row in Python.
+"""
+import re
+from datetime import datetime
+
+import numpy as np
+
+MISSING_VALUES = ("Not Available", "N/A", "")
+
+HOURS_PER_YEAR = 2080
+# Unit keyword -> working hours per unit, used to convert every rate to hourly.
+HOURS_PER_UNIT = {
+    "hour": 1.0,
+    "day": 8.0,
+    "week": 40.0,
+    "month": HOURS_PER_YEAR / 12,
+    "year": float(HOURS_PER_YEAR),
+}
+UNIT_ALIASES = {
+    "h": "hour", "hr": "hour", "hrs": "hour", "hour": "hour", "hours": "hour", "hourly": "hour",
+    "day": "day", "days": "day", "daily": "day",
+    "wk": "week", "week": "week", "weeks": "week", "weekly": "week",
+    "mo": "month", "month": "month", "months": "month", "monthly": "month",
+    "yr": "year", "year": "year", "years": "year", "yearly": "year",
+    "annual": "year", "annually": "year", "annum": "year",
+}
+CURRENCY_ALIASES = {
+    "$": "USD", "us$": "USD", "usd": "USD",
+    "c$": "CAD", "cad": "CAD",
+    "€": "EUR", "eur": "EUR",
+    "£": "GBP", "gbp": "GBP",
+    "₹": "INR", "inr": "INR",
+}
+# Without a unit, amounts at or above this are treated as annual salaries.
+ANNUAL_AMOUNT_THRESHOLD = 1000
+
+_CURRENCY = r"US\$|C\$|\$|€|£|₹|USD|CAD|EUR|GBP|INR"
+_AMOUNT = r"\d[\d,]*(?:\.\d+)?(?:\s*[kK]\b)?"
+_UNIT = "|".join(sorted(UNIT_ALIASES, key=len, reverse=True))
+PAY_RE = re.compile(
+    rf"(?P<cur>{_CURRENCY})?\s*(?P<lo>{_AMOUNT})"
+    rf"(?:\s*(?:-|–|to)\s*(?:{_CURRENCY})?\s*(?P<hi>{_AMOUNT}))?"
+    rf"\s*(?P<cur2>USD|CAD|EUR|GBP|INR)?"
+    rf"(?:\s*(?:/|per|an|a)?\s*(?P<unit>{_UNIT})\b)?",
+    re.IGNORECASE,
+)
+_RANGE_GAP_RE = re.compile(r"\s*(?:-|–|to)\s*", re.IGNORECASE)
+
+SECONDS_PER_UNIT = {
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "week": 7 * 86400,
+    "month": 30 * 86400,
+    "year": 365 * 86400,
+}
+POSTED_RE = re.compile(
+    r"(?P<today>today|just now)|(?P<yesterday>yesterday)"
+    r"|(?P<n>\d+)\+?\s*(?P<unit>minute|hour|day|week|month|year)s?\s+ago",
+    re.IGNORECASE,
+)
+POSTED_DATE_FORMATS = ("%b %d, %Y", "%B %d, %Y", "%m/%d/%Y", "%Y-%m-%d")
+
+
+def pay_text(job: dict) -> str | None:
+    """Pick the best pay text for a job: header pay badges first, then the overview chip."""
+    badges = job.get("Pay Information")
+    if isinstance(badges, list):
+        badges = " | ".join(badges)
+    for value in (badges, job.get("Pay")):
+        if isinstance(value, str) and value not in MISSING_VALUES and any(ch.isdigit() for ch in value):
+            return value
+    return None
+
+
+def _pay_groups(text: str | None) -> dict:
+    """First amount with a currency or unit attached, else the first bare amount."""
+    if not text:
+        return {}
+    matches = list(PAY_RE.finditer(text))
+    first = None
+    for i, match in enumerate(matches):
+        groups = match.groupdict()
+        if groups["cur"] or groups["cur2"] or groups["unit"]:
+            if i + 1 < len(matches):
+                groups = _merge_range(text, match, matches[i + 1])
+            return groups
+        if first is None:
+            first = groups
+    return first or {}
+
+
+def _merge_range(text: str, match: re.Match, following: re.Match) -> dict:
+    """
+    '$50/hr - $60/hr': each side carries its own unit, so PAY_RE matches them
+    separately. Take the second amount as the range maximum when only a
+    range separator sits between them and units/currencies agree.
+    """
+    groups = match.groupdict()
+    other = following.groupdict()
+    if groups["hi"] or other["hi"] or not _RANGE_GAP_RE.fullmatch(text, match.end(), following.start()):
+        return groups
+
+    unit = UNIT_ALIASES.get((groups["unit"] or "").lower())
+    other_unit = UNIT_ALIASES.get((other["unit"] or "").lower())
+    currency = CURRENCY_ALIASES.get((groups["cur"] or groups["cur2"] or "").lower())
+    other_currency = CURRENCY_ALIASES.get((other["cur"] or other["cur2"] or "").lower())
+    if (unit and other_unit and unit != other_unit) or (
+            currency and other_currency and currency != other_currency):
+        return groups
+
+    return {
+        **groups,
+        "hi": other["lo"],
+        "unit": groups["unit"] or other["unit"],
+        "cur2": groups["cur2"] or other["cur2"],
+    }
+
+
+def _parse_amounts(amounts: np.ndarray) -> np.ndarray:
+    """'120,000' / '65.50' / '120k' string array -> float array (NaN for '')."""
+    cleaned = np.char.replace(np.char.lower(amounts), ",", "")
+    thousands = np.char.endswith(cleaned, "k")
+    cleaned = np.char.strip(np.char.rstrip(cleaned, "k"))
+    values = np.full(cleaned.shape, np.nan)
+    present = cleaned != ""
+    values[present] = cleaned[present].astype(np.float64)
+    return np.where(thousands, values * 1000, values)
+
+
+def normalize_pay(texts: list[str | None]) -> dict[str, np.ndarray]:
+    """
+    Parse pay texts into hourly rates.
+
+    Returns arrays (one entry per input):
+      rate_min_hourly, rate_max_hourly  float64, NaN when no amount was found
+      currency                          ISO code or None
+    """
+    groups = [_pay_groups(text) for text in texts]
+
+    lo = np.array([g.get("lo") or "" for g in groups], dtype=str)
+    hi = np.array([g.get("hi") or "" for g in groups], dtype=str)
+    units = np.array([UNIT_ALIASES.get((g.get("unit") or "").lower(), "") for g in groups], dtype=str)
+    currency = np.array(
+        [CURRENCY_ALIASES.get((g.get("cur") or g.get("cur2") or "").lower()) for g in groups],
+        dtype=object,
+    )
+
+    if not len(lo):
+        empty = np.empty(0)
+        return {"rate_min_hourly": empty, "rate_max_hourly": empty.copy(), "currency": currency}
+
+    low = _parse_amounts(lo)
+    high = _parse_amounts(hi)
+    high = np.where(np.isnan(high), low, high)
+
+    hours = np.full(low.shape, np.nan)
+    for unit, unit_hours in HOURS_PER_UNIT.items():
+        hours[units == unit] = unit_hours
+    guessed = np.isnan(hours)
+    hours[guessed] = np.where(low[guessed] >= ANNUAL_AMOUNT_THRESHOLD, float(HOURS_PER_YEAR), 1.0)
+
+    rate_min = low / hours
+    rate_max = high / hours
+    return {
+        "rate_min_hourly": np.fmin(rate_min, rate_max),
+        "rate_max_hourly": np.fmax(rate_min, rate_max),
+        "currency": currency,
+    }
+
+
+def normalize_posted(texts: list[str | None], reference: datetime) -> np.ndarray:
+    """
+    Turn 'Posted 3 days ago' / 'Posted today' / 'Posted Jan 10, 2026' into
+    absolute datetime64[s] values relative to reference (the scrape time).
+    NaT where nothing could be parsed.
+    """
+    absolute = np.full(len(texts), np.datetime64("NaT"), dtype="datetime64[s]")
+
+    counts = np.zeros(len(texts), dtype=np.int64)
+    unit_seconds = np.zeros(len(texts), dtype=np.int64)
+    for row, text in enumerate(texts):
+        if not text or text in MISSING_VALUES:
+            continue
+        match = POSTED_RE.search(text)
+        if match is None:
+            parsed = _parse_posted_date(text)
+            if parsed is not None:
+                absolute[row] = np.datetime64(parsed, "s")
+            continue
+        if match["today"]:
+            unit_seconds[row] = 1
+        elif match["yesterday"]:
+            counts[row], unit_seconds[row] = 1, SECONDS_PER_UNIT["day"]
+        else:
+            counts[row], unit_seconds[row] = int(match["n"]), SECONDS_PER_UNIT[match["unit"].lower()]
+
+    relative = unit_seconds > 0  # "today" uses 1s units with a zero count
+    ages = counts * unit_seconds
+
+    reference_s = np.datetime64(reference, "s")
+    return np.where(relative, reference_s - ages.astype("timedelta64[s]"), absolute)
+
+
+def _parse_posted_date(text: str) -> datetime | None:
+    cleaned = re.sub(r"^(posted|updated)\s+", "", text.strip(), flags=re.IGNORECASE)
+    for fmt in POSTED_DATE_FORMATS:
+        try:
+            return datetime.strptime(cleaned, fmt)
+        except ValueError:
+            continue
+    return None
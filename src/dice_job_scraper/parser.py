@@ -8,7 +8,11 @@ def extract_total_pages(html: str) -> int:
     section = soup.find("section", {"aria-label": lambda x: x and "Page" in x})
     if not section:
         return 1
-    text = section.get_text(strip=True)
+    return total_pages_from_text(section.get_text(strip=True))
+
+
+def total_pages_from_text(text: str) -> int:
+    """Parse the pagination label text, e.g. 'Page 1 of 7' -> 7."""
     return int(text.split("of")[-1])
 
 
@@ -0,0 +1,339 @@
+import asyncio
+import cProfile
+import collections.abc
+import json
+import logging
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Set while a `--profile` run is active; sections are no-ops otherwise.
+_active_profiler = None
+
+
+@contextmanager
+def profile_section(name: str):
+    """
+    Time a scoped part of the run (scrape loop, parse calls, exporters).
+
+    Costs a single global lookup when profiling is off.
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        yield
+        return
+
+    profiler.enter_section(name)
+    start_wall = time.perf_counter()
+    start_cpu = time.thread_time()
+    start_busy = _current_busy()
+    try:
+        yield
+    finally:
+        end_busy = _current_busy()
+        profiler.exit_section(
+            name,
+            wall=time.perf_counter() - start_wall,
+            cpu=time.thread_time() - start_cpu,
+            busy=None if start_busy is None or end_busy is None else end_busy - start_busy,
+        )
+
+
+def _current_busy() -> float | None:
+    """Loop-holding time of the current task so far, None outside a profiled task."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        return None
+    coro = task.get_coro() if task is not None else None
+    if not isinstance(coro, _TimedCoroutine):
+        return None
+    return coro.busy_now()
+
+
+class _TimedCoroutine(collections.abc.Coroutine):
+    """
+    Coroutine wrapper that measures how long each step holds the event loop.
+
+    Step time is wall time, not CPU time: a blocking call such as
+    time.sleep() holds the loop without using CPU and must count as busy.
+    """
+
+    def __init__(self, coro, stats: dict):
+        self._coro = coro
+        self._stats = stats
+        self._busy = 0.0
+        self._step_started = None
+
+    def busy_now(self) -> float:
+        if self._step_started is None:
+            return self._busy
+        return self._busy + time.perf_counter() - self._step_started
+
+    def _step(self, method, *args):
+        self._step_started = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            elapsed = time.perf_counter() - self._step_started
+            self._step_started = None
+            self._busy += elapsed
+            self._stats["busy"] += elapsed
+            self._stats["steps"] += 1
+            self._stats["max_step"] = max(self._stats["max_step"], elapsed)
+
+    def send(self, value):
+        return self._step(self._coro.send, value)
+
+    def throw(self, *args):
+        return self._step(self._coro.throw, *args)
+
+    def close(self):
+        return self._coro.close()
+
+    def __await__(self):
+        return self
+
+
+class _StackSampler(threading.Thread):
+    """Samples the main thread's stack into flamegraph "folded" counts."""
+
+    def __init__(self, profiler: "RunProfiler", interval: float):
+        super().__init__(name="profile-sampler", daemon=True)
+        self._profiler = profiler
+        self._interval = interval
+        self._target_id = threading.main_thread().ident
+        self._stop_event = threading.Event()
+        self.samples: dict[str, int] = {}
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            if not self._profiler.in_section:
+                continue
+            frame = sys._current_frames().get(self._target_id)
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                frame = frame.f_back
+            key = ";".join(reversed(stack))
+            self.samples[key] = self.samples.get(key, 0) + 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+class RunProfiler:
+    """
+    CPU, allocation and asyncio task profiling for a single scraper run.
+
+    Writes to output_dir:
+      - profile_<ts>.prof          cProfile stats (snakeviz / pstats)
+      - profile_<ts>.folded        sampled stacks (flamegraph.pl / speedscope)
+      - profile_<ts>_alloc.txt     top-N allocation sites grown over each outermost section
+      - profile_<ts>_summary.json  section and per-task wall-time attribution, peak traced memory
+
+    Busy/waiting attribution needs the code to run in a task created after
+    start() (the task factory wraps it); the asyncio.run main task is not.
+    """
+
+    def __init__(self, output_dir: str, top_n: int = 25, sample_interval: float = 0.005):
+        self.output_dir = Path(output_dir)
+        self.top_n = top_n
+        self.sample_interval = sample_interval
+
+        self._cprofile = cProfile.Profile()
+        self._sampler = None
+        self._depth = 0
+        self._sections: dict[str, dict] = {}
+        self._peaks: list[int] = []  # peak traced bytes of each open section, innermost last
+        self._alloc_before: dict[str, tracemalloc.Snapshot] = {}  # outermost section -> snapshot at first entry
+        self._alloc_after: dict[str, tracemalloc.Snapshot] = {}  # ... and at last exit
+        self._tasks: dict[str, dict] = {}
+        self._loop = None
+        self._previous_factory = None
+        self._started_at = 0.0
+
+    @property
+    def in_section(self) -> bool:
+        return self._depth > 0
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        global _active_profiler
+
+        self._loop = loop
+        self._previous_factory = loop.get_task_factory()
+        loop.set_task_factory(self._task_factory)
+
+        tracemalloc.start()
+        self._sampler = _StackSampler(self, self.sample_interval)
+        self._sampler.start()
+        self._started_at = time.perf_counter()
+
+        _active_profiler = self
+        logger.info("Profiling enabled | output_dir=%s", self.output_dir)
+
+    def stop(self) -> dict:
+        global _active_profiler
+
+        _active_profiler = None
+        total_wall = time.perf_counter() - self._started_at
+
+        self._sampler.stop()
+        tracemalloc.stop()
+        self._loop.set_task_factory(self._previous_factory)
+
+        return self._write_reports(total_wall)
+
+    def enter_section(self, name: str) -> None:
+        # Only the outermost section toggles cProfile and takes allocation
+        # snapshots; every section tracks its own peak traced memory.
+        if self._depth == 0:
+            if name not in self._alloc_before:
+                self._alloc_before[name] = tracemalloc.take_snapshot()
+            self._cprofile.enable()
+        else:
+            # The enclosing section keeps the peak reached before this reset
+            self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        self._peaks.append(0)
+        self._depth += 1
+
+    def exit_section(self, name: str, wall: float, cpu: float, busy: float | None = None) -> None:
+        peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], peak)
+        self._depth -= 1
+        if self._depth == 0:
+            self._cprofile.disable()
+            self._alloc_after[name] = tracemalloc.take_snapshot()
+
+        stats = self._sections.setdefault(
+            name, {"calls": 0, "wall": 0.0, "cpu": 0.0, "busy": 0.0, "peak": 0,
+                   "unattributed_calls": 0, "unattributed_wall": 0.0}
+        )
+        stats["calls"] += 1
+        stats["peak"] = max(stats["peak"], peak)
+        stats["wall"] += wall
+        stats["cpu"] += cpu
+        if busy is None:
+            # Entered outside a task created by the profiler's task factory
+            # (e.g. the asyncio.run main task): loop-holding time is unknown.
+            stats["unattributed_calls"] += 1
+            stats["unattributed_wall"] += wall
+        else:
+            stats["busy"] += busy
+
+    def _task_factory(self, loop, coro, **kwargs):
+        name = getattr(coro, "__qualname__", type(coro).__name__)
+        stats = self._tasks.setdefault(
+            name, {"tasks": 0, "steps": 0, "busy": 0.0, "max_step": 0.0, "wall": 0.0}
+        )
+        stats["tasks"] += 1
+        created = time.perf_counter()
+
+        task = asyncio.Task(_TimedCoroutine(coro, stats), loop=loop, **kwargs)
+
+        def _on_done(_task) -> None:
+            stats["wall"] += time.perf_counter() - created
+
+        task.add_done_callback(_on_done)
+        return task
+
+    def _write_reports(self, total_wall: float) -> dict:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = "profile_" + datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+        prof_path = self.output_dir / f"{stem}.prof"
+        self._cprofile.dump_stats(prof_path)
+
+        folded_path = self.output_dir / f"{stem}.folded"
+        with folded_path.open("w", encoding="utf-8") as f:
+            for stack, count in sorted(self._sampler.samples.items()):
+                f.write(f"{stack} {count}\n")
+
+        alloc_path = self.output_dir / f"{stem}_alloc.txt"
+        filters = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),  # the profiler's own bookkeeping
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        )
+        with alloc_path.open("w", encoding="utf-8") as f:
+            if not self._alloc_after:
+                f.write("No profiled section ran\n")
+            # Growth from first entering an outermost section to last leaving
+            # it: what the section allocated and still held, not import-time state
+            for name, after in self._alloc_after.items():
+                before = self._alloc_before[name].filter_traces(filters)
+                diff = after.filter_traces(filters).compare_to(before, "lineno")
+                f.write(f"Top {self.top_n} allocation sites grown during {name}\n")
+                for index, stat in enumerate(diff[: self.top_n], 1):
+                    frame = stat.traceback[0]
+                    f.write(
+                        f"#{index}: {frame.filename}:{frame.lineno} "
+                        f"{stat.size_diff / 1024:+.1f} KiB ({stat.count_diff:+d} blocks), "
+                        f"{stat.size / 1024:.1f} KiB live at exit\n"
+                    )
+                total = sum(stat.size_diff for stat in diff)
+                f.write(f"Net allocated during {name}: {total / 1024:+.1f} KiB\n\n")
+
+        # Per-task attribution: "busy" is time the task's own steps held the
+        # event loop (blocking), "waiting" is the rest of its lifetime spent
+        # suspended on I/O such as Playwright/network round trips.
+        tasks = {}
+        for name, stats in sorted(self._tasks.items(), key=lambda item: -item[1]["busy"]):
+            tasks[name] = {
+                "tasks": stats["tasks"],
+                "steps": stats["steps"],
+                "busy_s": round(stats["busy"], 4),
+                "max_step_s": round(stats["max_step"], 4),
+                "waiting_s": round(max(stats["wall"] - stats["busy"], 0.0), 4),
+            }
+
+        # Per-section attribution uses the same step timing for the task that
+        # entered the section: "busy" blocked the loop (parsing, time.sleep,
+        # sync I/O), "waiting" was spent suspended in awaits. "cpu" is kept
+        # separately; busy minus cpu is blocking time that used no CPU.
+        sections = {}
+        for name, stats in self._sections.items():
+            section = {
+                "calls": stats["calls"],
+                "wall_s": round(stats["wall"], 4),
+                "cpu_s": round(stats["cpu"], 4),
+                "peak_traced_mib": round(stats["peak"] / 1024 / 1024, 3),
+            }
+            attributed_wall = stats["wall"] - stats["unattributed_wall"]
+            if stats["calls"] > stats["unattributed_calls"]:
+                section["busy_s"] = round(stats["busy"], 4)
+                section["waiting_s"] = round(max(attributed_wall - stats["busy"], 0.0), 4)
+            if stats["unattributed_calls"]:
+                section["unattributed_calls"] = stats["unattributed_calls"]
+            sections[name] = section
+
+        summary = {
+            "total_wall_s": round(total_wall, 4),
+            "sections": sections,
+            "tasks": tasks,
+            "files": {
+                "cprofile": str(prof_path),
+                "folded": str(folded_path),
+                "allocations": str(alloc_path),
+            },
+        }
+        summary_path = self.output_dir / f"{stem}_summary.json"
+        with summary_path.open("w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+        logger.info("Profile written | summary=%s", summary_path)
+        return summary
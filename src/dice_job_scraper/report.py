@@ -0,0 +1,308 @@
+"""
+Streaming rate analytics over scraped outputs (`dice-scraper report`).
+
+Files are read in fixed-size batches with only the needed columns kept, each
+batch is normalized with normalize.py, and per-group fixed-width histograms
+are updated with NumPy. Jobs re-scraped into several exports are counted
+once, newest export first, using 8-byte URL hashes; apart from that memory
+depends on the batch size and the number of distinct groups, not on the
+number of jobs.
+"""
+import hashlib
+import json
+import logging
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from .normalize import MISSING_VALUES, normalize_pay, normalize_posted, pay_text
+
+logger = logging.getLogger(__name__)
+
+REPORT_COLUMNS = (
+    "url",
+    "Pay Information",
+    "Pay",
+    "Posted Date",
+    "Primary Skill Set",
+    "Location",
+    "location",
+    "Work Arrangement",
+)
+BIN_WIDTH = 2.5  # $/hr per histogram bin
+NUM_BINS = 200  # 0 - 500 $/hr, the last bin also takes everything above
+WORK_ARRANGEMENTS = (("remote", "Remote"), ("hybrid", "Hybrid"), ("on-site", "On-Site"), ("onsite", "On-Site"))
+_FILENAME_TS_RE = re.compile(r"(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})")
+
+
+def reference_time(path: Path) -> datetime:
+    """Scrape time for relative 'Posted N days ago' values: the exporter's filename timestamp, else mtime."""
+    match = _FILENAME_TS_RE.search(path.name)
+    if match:
+        return datetime.strptime(match.group(1), "%Y-%m-%d_%H-%M-%S")
+    return datetime.fromtimestamp(path.stat().st_mtime)
+
+
+def expand_paths(paths: list[str]) -> list[Path]:
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if p.suffix in (".jsonl", ".parquet")))
+        else:
+            files.append(path)
+    return files
+
+
+def iter_job_batches(path: Path, batch_size: int, columns=REPORT_COLUMNS):
+    """Yield lists of jobs projected to columns (None keeps all), batch_size at a time."""
+    if path.suffix == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Reading Parquet requires pyarrow: pip install pyarrow") from e
+
+        parquet = pq.ParquetFile(path)
+        if columns is not None:
+            columns = [name for name in columns if name in parquet.schema_arrow.names]
+        for record_batch in parquet.iter_batches(batch_size=batch_size, columns=columns):
+            yield record_batch.to_pylist()
+        return
+
+    batch = []
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            job = json.loads(line)
+            if columns is not None:
+                job = {key: job[key] for key in columns if key in job}
+            batch.append(job)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def work_arrangement_labels(value) -> list[str]:
+    """Bucket free-text arrangements ('Hybrid in Albany, NY', ['Remote']) into Remote/Hybrid/On-Site."""
+    texts = value if isinstance(value, list) else [value]
+    labels = []
+    for text in texts:
+        if not isinstance(text, str):
+            continue
+        lowered = text.lower()
+        for keyword, label in WORK_ARRANGEMENTS:
+            if keyword in lowered and label not in labels:
+                labels.append(label)
+    return labels or ["Unknown"]
+
+
+class SeenUrls:
+    """
+    URLs already counted, kept as 64-bit hashes (8 bytes per distinct URL) in
+    sorted runs. A batch's new hashes become a run, and a run is merged into
+    the one before it while that one is at most twice its size, so there are
+    O(log n) runs and each hash is merged O(log n) times.
+    """
+
+    def __init__(self):
+        self._runs: list[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return sum(len(run) for run in self._runs)
+
+    def first_seen(self, urls: list) -> np.ndarray:
+        """Mask of jobs to count: first occurrence of a URL, or no usable URL."""
+        keep = np.ones(len(urls), dtype=bool)
+        rows = [i for i, url in enumerate(urls) if isinstance(url, str) and url not in MISSING_VALUES]
+        if not rows:
+            return keep
+
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(urls[i].encode("utf-8"), digest_size=8).digest(), "little")
+             for i in rows),
+            dtype=np.uint64,
+            count=len(rows),
+        )
+        _, first_in_batch = np.unique(hashes, return_index=True)
+        new = np.zeros(len(rows), dtype=bool)
+        new[first_in_batch] = True
+
+        for run in self._runs:
+            positions = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+            new &= run[positions] != hashes
+
+        keep[rows] = new
+        if new.any():
+            self._runs.append(np.sort(hashes[new]))
+            while len(self._runs) > 1 and len(self._runs[-2]) <= 2 * len(self._runs[-1]):
+                last = self._runs.pop()
+                # Two sorted runs: the stable sort (timsort) merges them in linear time
+                self._runs[-1] = np.sort(np.concatenate([self._runs[-1], last]), kind="stable")
+        return keep
+
+
+class GroupedRateStats:
+    """Per-group hourly rate histograms, updated a batch at a time."""
+
+    def __init__(self):
+        self._codes: dict[str, int] = {}
+        self.hist = np.zeros((0, NUM_BINS), dtype=np.int64)
+        self.total = np.zeros(0)
+        self.low = np.zeros(0)
+        self.high = np.zeros(0)
+
+    def _grow(self) -> None:
+        missing = len(self._codes) - len(self.total)
+        if missing <= 0:
+            return
+        self.hist = np.vstack([self.hist, np.zeros((missing, NUM_BINS), dtype=np.int64)])
+        self.total = np.concatenate([self.total, np.zeros(missing)])
+        self.low = np.concatenate([self.low, np.full(missing, np.inf)])
+        self.high = np.concatenate([self.high, np.full(missing, -np.inf)])
+
+    def add(self, labels: list[str], rates: np.ndarray) -> None:
+        if not labels:
+            return
+        codes = np.fromiter(
+            (self._codes.setdefault(label, len(self._codes)) for label in labels),
+            dtype=np.int64,
+            count=len(labels),
+        )
+        self._grow()
+
+        bins = np.minimum((rates / BIN_WIDTH).astype(np.int64), NUM_BINS - 1)
+        np.add.at(self.hist, (codes, bins), 1)
+        np.add.at(self.total, codes, rates)
+        np.minimum.at(self.low, codes, rates)
+        np.maximum.at(self.high, codes, rates)
+
+    def rows(self, top: int | None = None) -> list[dict]:
+        """Groups ordered by job count, with histogram-estimated quartiles."""
+        counts = self.hist.sum(axis=1)
+        order = np.argsort(-counts, kind="stable")[:top]
+        labels = list(self._codes)
+
+        cumulative = np.cumsum(self.hist, axis=1)
+        rows = []
+        for code in order:
+            n = int(counts[code])
+
+            def quantile(q: float) -> float:
+                bin_index = int(np.searchsorted(cumulative[code], q * n))
+                estimate = min(max((bin_index + 0.5) * BIN_WIDTH, self.low[code]), self.high[code])
+                return round(float(estimate), 2)
+
+            rows.append({
+                "group": labels[code],
+                "jobs": n,
+                "min": round(float(self.low[code]), 2),
+                "p25": quantile(0.25),
+                "median": quantile(0.5),
+                "p75": quantile(0.75),
+                "max": round(float(self.high[code]), 2),
+                "mean": round(float(self.total[code] / n), 2),
+            })
+        return rows
+
+
+def build_report(
+        paths: list[str],
+        currency: str = "USD",
+        since_days: int | None = None,
+        batch_size: int = 10_000,
+        top: int = 20,
+) -> dict:
+    """
+    Aggregate hourly rate distributions by skill, location and work
+    arrangement. Jobs whose pay has no explicit currency count as `currency`.
+    """
+    dimensions = {
+        "overall": GroupedRateStats(),
+        "skill": GroupedRateStats(),
+        "location": GroupedRateStats(),
+        "work_arrangement": GroupedRateStats(),
+    }
+    jobs_read = 0
+    jobs_duplicate = 0
+    jobs_with_rate = 0
+    seen_urls = SeenUrls()
+    cutoff = np.datetime64(datetime.now() - timedelta(days=since_days), "s") if since_days else None
+
+    # Newest export first, so a re-scraped job is counted with its latest pay
+    files = sorted(((reference_time(path), path) for path in expand_paths(paths)), reverse=True)
+    for reference, path in files:
+        for batch in iter_job_batches(path, batch_size):
+            jobs_read += len(batch)
+            first_seen = seen_urls.first_seen([job.get("url") for job in batch])
+            jobs_duplicate += int((~first_seen).sum())
+            batch = [job for job, keep in zip(batch, first_seen) if keep]
+
+            pay = normalize_pay([pay_text(job) for job in batch])
+            rates = (pay["rate_min_hourly"] + pay["rate_max_hourly"]) / 2
+            keep = ~np.isnan(rates) & np.array(
+                [code in (currency, None) for code in pay["currency"]], dtype=bool
+            )
+            if cutoff is not None:
+                posted = normalize_posted([job.get("Posted Date") for job in batch], reference)
+                keep &= ~np.isnat(posted) & (posted >= cutoff)
+
+            rows = np.flatnonzero(keep)
+            jobs_with_rate += len(rows)
+
+            labels = {name: [] for name in dimensions}
+            positions = {name: [] for name in dimensions}
+            for row in rows:
+                job = batch[row]
+                groups = {
+                    "overall": ["All jobs"],
+                    "skill": [
+                        skill.strip().lower() for skill in job.get("Primary Skill Set") or []
+                        if isinstance(skill, str) and skill.strip()
+                    ],
+                    "location": [
+                        next(
+                            (value for value in (job.get("Location"), job.get("location"))
+                             if isinstance(value, str) and value not in MISSING_VALUES),
+                            "Unknown",
+                        )
+                    ],
+                    "work_arrangement": work_arrangement_labels(job.get("Work Arrangement")),
+                }
+                for name, values in groups.items():
+                    labels[name].extend(values)
+                    positions[name].extend([row] * len(values))
+
+            for name, stats in dimensions.items():
+                stats.add(labels[name], rates[np.array(positions[name], dtype=np.int64)])
+
+        logger.info("Report input processed | path=%s | jobs_read=%s", path, jobs_read)
+
+    return {
+        "currency": currency,
+        "unit": "per hour",
+        "jobs_read": jobs_read,
+        "jobs_duplicate": jobs_duplicate,
+        "jobs_with_rate": jobs_with_rate,
+        **{name: stats.rows(None if name == "overall" else top) for name, stats in dimensions.items()},
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f"Hourly rates ({report['currency']}) from {report['jobs_with_rate']} of "
+        f"{report['jobs_read'] - report['jobs_duplicate']} jobs, {report['jobs_duplicate']} re-scraped "
+        f"duplicates skipped (quartiles estimated to ${BIN_WIDTH}/hr bins)",
+    ]
+    header = f"{'group':<40} {'jobs':>7} {'min':>8} {'p25':>8} {'median':>8} {'p75':>8} {'max':>8}"
+    for name in ("overall", "skill", "location", "work_arrangement"):
+        lines.extend(["", f"By {name.replace('_', ' ')}", header])
+        for row in report[name]:
+            lines.append(
+                f"{row['group'][:40]:<40} {row['jobs']:>7} {row['min']:>8.2f} {row['p25']:>8.2f} "
+                f"{row['median']:>8.2f} {row['p75']:>8.2f} {row['max']:>8.2f}"
+            )
+    return "\n".join(lines)
@@ -0,0 +1,242 @@
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+async def sleep_or_shutdown(seconds: float, shutdown_event: asyncio.Event | None = None) -> None:
+    """Sleep for seconds, returning early once shutdown_event is set."""
+    if shutdown_event is None:
+        await asyncio.sleep(seconds)
+        return
+    try:
+        await asyncio.wait_for(shutdown_event.wait(), timeout=seconds)
+    except asyncio.TimeoutError:
+        pass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how patiently to retry one class of detail-fetch error."""
+
+    max_retries: int
+    base_delay: float  # seconds before the first retry
+    max_delay: float
+
+    def delay(self, attempt: int) -> float:
+        """Exponential backoff for the given retry attempt (1-based)."""
+        return min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
+
+
+DEFAULT_RETRY_POLICIES = {
+    # Slow page or selector never appeared; usually transient load on Dice.
+    "TimeoutError": RetryPolicy(max_retries=2, base_delay=15.0, max_delay=60.0),
+    # net::ERR_* from Chromium (connection reset, DNS, aborted navigation).
+    "NetworkError": RetryPolicy(max_retries=3, base_delay=5.0, max_delay=60.0),
+    "default": RetryPolicy(max_retries=1, base_delay=5.0, max_delay=30.0),
+}
+
+
+def classify_error(exc: BaseException) -> str:
+    """Bucket an exception into a retry policy key."""
+    if isinstance(exc, (TimeoutError, asyncio.TimeoutError)) or type(exc).__name__ == "TimeoutError":
+        return "TimeoutError"
+    if "net::ERR_" in str(exc):
+        return "NetworkError"
+    return "default"
+
+
+@dataclass
+class RetryItem:
+    job: dict
+    error_class: str
+    attempts: int  # retries already scheduled for this job
+    ready_at: float
+
+
+class RetryQueue:
+    """
+    Deferred retries for failed detail fetches.
+
+    Failed jobs are parked here instead of being written half-empty, and
+    picked up again at the end of a page (if their backoff has elapsed) or at
+    the end of the run. save/load carry the queue over to a resumed run.
+    """
+
+    def __init__(self, policies: dict[str, RetryPolicy] | None = None, clock=time.monotonic):
+        self.policies = policies or DEFAULT_RETRY_POLICIES
+        self._clock = clock
+        self._items: list[RetryItem] = []
+        self.stats = {
+            "queued": 0,
+            "retried": 0,
+            "recovered": 0,
+            "gave_up": 0,
+            "abandoned": 0,  # still queued when the run was shut down
+            "restored": 0,  # loaded from a previous run's save
+            "errors_by_class": {},
+        }
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _policy(self, error_class: str) -> RetryPolicy:
+        return self.policies.get(error_class, self.policies["default"])
+
+    def push(self, job: dict, exc: BaseException, attempts: int = 0) -> bool:
+        """
+        Schedule a retry for job. Returns False when its policy is exhausted,
+        in which case the caller should keep the job as it is.
+        """
+        error_class = classify_error(exc)
+        errors = self.stats["errors_by_class"]
+        errors[error_class] = errors.get(error_class, 0) + 1
+
+        policy = self._policy(error_class)
+        if attempts >= policy.max_retries:
+            self.stats["gave_up"] += 1
+            return False
+
+        attempts += 1
+        self._items.append(
+            RetryItem(
+                job=job,
+                error_class=error_class,
+                attempts=attempts,
+                ready_at=self._clock() + policy.delay(attempts),
+            )
+        )
+        self.stats["queued"] += 1
+        return True
+
+    def pop_due(self) -> list[RetryItem]:
+        """Remove and return items whose backoff has elapsed."""
+        now = self._clock()
+        due = [item for item in self._items if item.ready_at <= now]
+        self._items = [item for item in self._items if item.ready_at > now]
+        return due
+
+    def abandon_all(self) -> list[RetryItem]:
+        """Remove and return everything still queued (e.g. on shutdown)."""
+        items, self._items = self._items, []
+        self.stats["abandoned"] += len(items)
+        return items
+
+    def save(self, path: Path) -> None:
+        """Write queued items to path as JSON lines; an empty queue removes the file."""
+        if not self._items:
+            path.unlink(missing_ok=True)
+            return
+        now = self._clock()
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for item in self._items:
+                record = {
+                    "job": item.job,
+                    "error_class": item.error_class,
+                    "attempts": item.attempts,
+                    "retry_in": max(item.ready_at - now, 0.0),
+                }
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        tmp_path.replace(path)
+
+    def load(self, path: Path) -> int:
+        """Queue the items saved at path, keeping their attempts and remaining backoff."""
+        if not path.exists():
+            return 0
+        now = self._clock()
+        with path.open("r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        for record in records:
+            self._items.append(
+                RetryItem(
+                    job=record["job"],
+                    error_class=record["error_class"],
+                    attempts=record["attempts"],
+                    ready_at=now + record["retry_in"],
+                )
+            )
+        self.stats["restored"] += len(records)
+        return len(records)
+
+    def seconds_until_next(self) -> float:
+        if not self._items:
+            return 0.0
+        return max(min(item.ready_at for item in self._items) - self._clock(), 0.0)
+
+
+class CircuitBreaker:
+    """
+    Pauses detail fetching when the recent failure rate spikes.
+
+    closed    -> normal operation, outcomes tracked over a sliding window
+    open      -> failure rate crossed the threshold; callers wait out cooldown
+    half_open -> one trial fetch; success closes, failure re-opens
+    """
+
+    def __init__(
+            self,
+            window: int = 10,
+            failure_threshold: float = 0.5,
+            min_calls: int = 5,
+            cooldown: float = 120.0,
+            clock=time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self._clock = clock
+        self._outcomes = deque(maxlen=window)
+        self._opened_at = 0.0
+        self.state = "closed"
+        self.stats = {"opened": 0, "paused_s": 0.0, "successes": 0, "failures": 0}
+
+    def record(self, success: bool) -> None:
+        self.stats["successes" if success else "failures"] += 1
+
+        if self.state == "half_open":
+            if success:
+                logger.info("Circuit breaker closed after successful trial fetch")
+                self.state = "closed"
+                self._outcomes.clear()
+            else:
+                self._open()
+            return
+
+        self._outcomes.append(success)
+        failures = self._outcomes.count(False)
+        if (
+                len(self._outcomes) >= self.min_calls
+                and failures / len(self._outcomes) >= self.failure_threshold
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self.state = "open"
+        self._opened_at = self._clock()
+        self.stats["opened"] += 1
+        logger.warning(
+            "Circuit breaker opened | recent_failures=%s/%s | cooldown=%ss",
+            self._outcomes.count(False),
+            len(self._outcomes),
+            self.cooldown,
+        )
+
+    async def wait_until_closed(self, shutdown_event: asyncio.Event | None = None) -> None:
+        """Block the caller while the breaker is open, then allow one trial call."""
+        if self.state != "open":
+            return
+
+        remaining = self._opened_at + self.cooldown - self._clock()
+        if remaining > 0:
+            logger.warning("Circuit breaker open, pausing detail fetches for %.0fs", remaining)
+            start = self._clock()
+            await sleep_or_shutdown(remaining, shutdown_event)
+            self.stats["paused_s"] += self._clock() - start
+
+        self.state = "half_open"
@@ -2,16 +2,26 @@
 import asyncio
 import logging
 import time
+from pathlib import Path
 from urllib.parse import urlencode
 
 from .config import BASE_URL, PAGE_TIMEOUT
 from .parser import extract_total_pages, extract_jobs
 from .exporter import write_jobs_to_csv, write_jobs_to_jsonl_async
 from .job_details import parse_job_page
-from .position_type_classifier import extract_position_type
+from .dom_extract import extract_job_page, extract_list_page
+from .dedup import DuplicateIndex
+from .profiling import profile_section
+from .retry import CircuitBreaker, RetryQueue, sleep_or_shutdown
+from .store import JobStore
+from .matching import MatchIndex
+from .models import JobRecord
 
 logger = logging.getLogger(__name__)
 
+# Deferred retries still pending after the last completed page, reloaded on --resume
+RETRY_QUEUE_FILE = "retry_queue.jsonl"
+
 
 def build_page_url(query_params: dict, page: int) -> str:
     params = query_params.copy()
@@ -19,19 +29,90 @@ def build_page_url(query_params: dict, page: int) -> str:
     return f"{BASE_URL}?{urlencode(params)}"
 
 
-async def scrape_job_details(page, job_url: str) -> dict:
-    try:
-        logger.info(f"Scraping details for page {job_url}")
-        await page.goto(job_url, timeout=30000)
-        await page.wait_for_selector("h1")
+async def fetch_job_details(page, job_url: str, extraction: str = "html") -> dict:
+    """Navigate to a job detail page and parse it. Raises on navigation/selector failures."""
+    logger.info(f"Scraping details for page {job_url}")
+    await page.goto(job_url, timeout=30000)
+    await page.wait_for_selector("h1")
 
-        html = await page.content()
-        logger.info("Page Content length %s", len(html))
+    if extraction == "dom":
+        with profile_section("extract_job_page"):
+            return await extract_job_page(page)
+
+    html = await page.content()
+    logger.info("Page Content length %s", len(html))
+    with profile_section("parse_job_page"):
         return parse_job_page(html)
 
+
+async def fetch_or_defer(
+        job: dict,
+        detail_page,
+        extraction: str,
+        retry_queue: RetryQueue,
+        breaker: CircuitBreaker,
+        shutdown_event: asyncio.Event | None = None,
+        attempts: int = 0,
+) -> bool:
+    """
+    Fetch details into job. On failure the job is parked in retry_queue and
+    False is returned; the caller must not write it yet.
+    """
+    await breaker.wait_until_closed(shutdown_event)
+    try:
+        details = await fetch_job_details(detail_page, job["url"], extraction)
     except Exception as e:
-        logger.warning("Failed to scrape job detail | url=%s | error=%s", job_url, str(e))
-        return {}
+        breaker.record(False)
+        deferred = retry_queue.push(job, e, attempts=attempts)
+        logger.warning(
+            "Failed to scrape job detail | url=%s | attempt=%s | deferred=%s | error=%s",
+            job["url"], attempts + 1, deferred, str(e),
+        )
+        return not deferred
+
+    breaker.record(True)
+    if attempts:
+        retry_queue.stats["recovered"] += 1
+    job.update(details)
+    return True
+
+
+async def retry_deferred(
+        items: list,
+        detail_page,
+        extraction: str,
+        retry_queue: RetryQueue,
+        breaker: CircuitBreaker,
+        shutdown_event: asyncio.Event | None = None,
+) -> list[dict]:
+    """Retry parked jobs; returns the ones that are finished (recovered or given up)."""
+    finished = []
+    for item in items:
+        retry_queue.stats["retried"] += 1
+        if await fetch_or_defer(
+                item.job, detail_page, extraction, retry_queue, breaker,
+                shutdown_event, attempts=item.attempts,
+        ):
+            finished.append(item.job)
+    return finished
+
+
+def drop_or_tag_duplicates(
+        jobs: list[dict],
+        dedup: DuplicateIndex,
+        suppress: bool,
+) -> tuple[list[dict], int]:
+    """
+    Tag near-duplicate jobs with a cluster ID; with suppress, drop them.
+    Returns the jobs to keep and the number dropped.
+    """
+    with profile_section("dedup"):
+        flags = dedup.tag(jobs)
+    if not suppress:
+        return jobs, 0
+
+    kept = [job for job, duplicate in zip(jobs, flags) if not duplicate]
+    return kept, len(jobs) - len(kept)
 
 
 async def scrape_pages(
@@ -44,9 +125,23 @@ async def scrape_pages(
         start_page: int = 1,
         shutdown_event: asyncio.Event | None = None,
         save_progress=None,  # callable: (page_num: int, query: dict) -> None
+        extraction: str = "html",  # "html": page.content() + BeautifulSoup, "dom": in-page evaluate
+        run_summary: dict | None = None,  # filled with timing, retry and circuit breaker statistics
+        store: JobStore | None = None,  # upserted after every page
+        dedup: DuplicateIndex | None = None,
+        suppress_duplicates: bool = False,  # skip export/store for near-duplicates
+        match_index: MatchIndex | None = None,  # resume-matching vectors, appended after every page
+        resume: bool = False,  # re-queue the retries a previous run left in output_dir
 ):
-    all_jobs = []
+    started_at = time.perf_counter()
+    all_jobs: list[JobRecord] = []  # compact copies; the per-page dicts are dropped after export
+    suppressed_count = 0
+    retry_queue = RetryQueue()
+    breaker = CircuitBreaker()
     jsonl_path = await write_jobs_to_jsonl_async(jobs=[], output_dir=output_dir)
+    retry_path = Path(output_dir) / RETRY_QUEUE_FILE
+    if resume and retry_queue.load(retry_path):
+        logger.info("Restored deferred retries | path=%s | jobs=%s", retry_path, len(retry_queue))
 
     current_page = start_page
     last_page = start_page + max_pages - 1
@@ -64,11 +159,18 @@ async def scrape_pages(
 
         await list_page.goto(url, timeout=PAGE_TIMEOUT)
         await list_page.wait_for_selector('div[role="listitem"]')
+        if run_summary is not None and "time_to_first_listing_s" not in run_summary:
+            run_summary["time_to_first_listing_s"] = time.perf_counter() - started_at
 
-        html = await list_page.content()
+        if extraction == "dom":
+            with profile_section("extract_list_page"):
+                total_pages, jobs = await extract_list_page(list_page, jobs_per_page)
+        else:
+            html = await list_page.content()
 
-        total_pages = extract_total_pages(html)
-        jobs = extract_jobs(html, jobs_per_page)
+            with profile_section("parse_list_page"):
+                total_pages = extract_total_pages(html)
+                jobs = extract_jobs(html, jobs_per_page)
 
         logger.info(
             "Page scraped",
@@ -83,23 +185,46 @@ async def scrape_pages(
         for job in jobs:
             time.sleep(10)
             if job["url"] != "N/A":
-                details = await scrape_job_details(detail_page, job["url"])
-                job.update(details)
+                if not await fetch_or_defer(
+                        job, detail_page, extraction, retry_queue, breaker, shutdown_event
+                ):
+                    continue
                 # AI classification not needed as we can extract this details from page badges itself.
                 # position = extract_position_type(details.get("Job Description"))
                 # logger.info(f"Position type {position}")
 
             detailed_jobs.append(job)
 
-        all_jobs.extend(detailed_jobs)
-        jsonl_path = await write_jobs_to_jsonl_async(
-            detailed_jobs,
-            output_dir,
-            append=True,
-            jsonl_path=jsonl_path,
+        # Retry earlier failures whose backoff has already elapsed
+        detailed_jobs.extend(
+            await retry_deferred(
+                retry_queue.pop_due(), detail_page, extraction, retry_queue, breaker, shutdown_event
+            )
         )
 
-        # Persist progress after each successful page
+        if dedup is not None:
+            detailed_jobs, suppressed = drop_or_tag_duplicates(detailed_jobs, dedup, suppress_duplicates)
+            suppressed_count += suppressed
+
+        all_jobs.extend(map(JobRecord.from_dict, detailed_jobs))
+        if detailed_jobs:
+            with profile_section("export_jsonl"):
+                jsonl_path = await write_jobs_to_jsonl_async(
+                    detailed_jobs,
+                    output_dir,
+                    append=True,
+                    jsonl_path=jsonl_path,
+                )
+            if store is not None:
+                with profile_section("export_store"):
+                    store.upsert_jobs(detailed_jobs)
+            if match_index is not None:
+                with profile_section("export_match_index"):
+                    match_index.add_jobs(detailed_jobs)
+
+        # Persist progress after each successful page; jobs still waiting for a
+        # retry go to the sidecar first so a crash after this point can't lose them
+        retry_queue.save(retry_path)
         if save_progress is not None:
             save_progress(current_page, query_params)
 
@@ -109,7 +234,51 @@ async def scrape_pages(
 
         current_page += 1
 
-    csv_path = write_jobs_to_csv(all_jobs, output_dir)
+    # End of run: wait out remaining backoffs, then write whatever is left
+    leftover_jobs = []
+    while len(retry_queue):
+        if shutdown_event is not None and shutdown_event.is_set():
+            # Written half-empty below; the sidecar lets --resume fetch them again
+            retry_queue.save(retry_path)
+            leftover_jobs.extend(item.job for item in retry_queue.abandon_all())
+            break
+        await sleep_or_shutdown(retry_queue.seconds_until_next(), shutdown_event)
+        leftover_jobs.extend(
+            await retry_deferred(
+                retry_queue.pop_due(), detail_page, extraction, retry_queue, breaker, shutdown_event
+            )
+        )
+    else:
+        retry_queue.save(retry_path)  # drained: nothing left to resume
+
+    if dedup is not None:
+        leftover_jobs, suppressed = drop_or_tag_duplicates(leftover_jobs, dedup, suppress_duplicates)
+        suppressed_count += suppressed
+
+    if leftover_jobs:
+        all_jobs.extend(map(JobRecord.from_dict, leftover_jobs))
+        with profile_section("export_jsonl"):
+            jsonl_path = await write_jobs_to_jsonl_async(
+                leftover_jobs,
+                output_dir,
+                append=True,
+                jsonl_path=jsonl_path,
+            )
+        if store is not None:
+            with profile_section("export_store"):
+                store.upsert_jobs(leftover_jobs)
+        if match_index is not None:
+            with profile_section("export_match_index"):
+                match_index.add_jobs(leftover_jobs)
+
+    if run_summary is not None:
+        run_summary["retry"] = retry_queue.stats
+        run_summary["circuit_breaker"] = breaker.stats
+        if dedup is not None:
+            run_summary["dedup"] = {**dedup.stats, "suppressed": suppressed_count}
+
+    with profile_section("export_csv"):
+        csv_path = write_jobs_to_csv(all_jobs, output_dir)
     logger.info(
         "All exports complete | csv=%s | jsonl=%s", csv_path, jsonl_path
     )
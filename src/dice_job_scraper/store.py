@@ -0,0 +1,283 @@
+import json
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from .job_details import BADGE_FLAGS, badge_flags, flag_names
+from .normalize import normalize_pay, normalize_posted, pay_text
+
+logger = logging.getLogger(__name__)
+
+MISSING_VALUES = ("Not Available", "N/A", "")
+
+# Badge columns from classify_all_badges -> kind stored in job_badges
+BADGE_FIELDS = {
+    "Position Types": "position_type",
+    "Work Arrangement": "work_arrangement",
+    "Pay Information": "pay",
+    "Other Badges": "other",
+}
+# job_badges kind for canonical BADGE_FLAGS names, the rows --badge filters on
+FLAG_KIND = "flag"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT,
+    company TEXT COLLATE NOCASE,
+    location TEXT COLLATE NOCASE,
+    posted_date TEXT,
+    posted_at TEXT,
+    rate_min_hourly REAL,
+    rate_max_hourly REAL,
+    pay_currency TEXT,
+    description TEXT,
+    skills TEXT,
+    data TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location);
+CREATE INDEX IF NOT EXISTS idx_jobs_posted_at ON jobs(posted_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_rate_max ON jobs(rate_max_hourly);
+
+CREATE TABLE IF NOT EXISTS job_badges (
+    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    label TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (job_id, kind, label)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_job_badges_label ON job_badges(kind, label, job_id);
+
+-- External-content FTS index kept in sync by triggers, so upserts update it incrementally.
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, description, skills,
+    content='jobs', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, description, skills)
+    VALUES (new.id, new.title, new.description, new.skills);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, description, skills)
+    VALUES ('delete', old.id, old.title, old.description, old.skills);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, description, skills)
+    VALUES ('delete', old.id, old.title, old.description, old.skills);
+    INSERT INTO jobs_fts(rowid, title, description, skills)
+    VALUES (new.id, new.title, new.description, new.skills);
+END;
+"""
+
+UPSERT_SQL = """
+INSERT INTO jobs (
+    url, title, company, location, posted_date, posted_at,
+    rate_min_hourly, rate_max_hourly, pay_currency,
+    description, skills, data, updated_at
+)
+VALUES (
+    :url, :title, :company, :location, :posted_date, :posted_at,
+    :rate_min_hourly, :rate_max_hourly, :pay_currency,
+    :description, :skills, :data, :updated_at
+)
+ON CONFLICT(url) DO UPDATE SET
+    title = excluded.title,
+    company = excluded.company,
+    location = excluded.location,
+    posted_date = excluded.posted_date,
+    posted_at = excluded.posted_at,
+    rate_min_hourly = excluded.rate_min_hourly,
+    rate_max_hourly = excluded.rate_max_hourly,
+    pay_currency = excluded.pay_currency,
+    description = excluded.description,
+    skills = excluded.skills,
+    data = excluded.data,
+    updated_at = excluded.updated_at
+RETURNING id
+"""
+
+
+def _field(job: dict, *keys: str) -> str | None:
+    """First present value among keys (detail page keys first, list page keys as fallback)."""
+    for key in keys:
+        value = job.get(key)
+        if isinstance(value, str) and value not in MISSING_VALUES:
+            return value
+    return None
+
+
+def _as_list(value) -> list[str]:
+    if isinstance(value, list):
+        return [item for item in value if item not in MISSING_VALUES]
+    if isinstance(value, str) and value not in MISSING_VALUES:
+        return [value]
+    return []
+
+
+def derived_columns(jobs: list[dict], reference: datetime) -> list[dict]:
+    """
+    Normalized, filterable columns for a batch of jobs: absolute posted time
+    (relative "Posted 3 days ago" resolved against reference, the scrape
+    time) and hourly pay range.
+    """
+    posted = normalize_posted([_field(job, "Posted Date") for job in jobs], reference)
+    pay = normalize_pay([pay_text(job) for job in jobs])
+    rows = []
+    for i, job in enumerate(jobs):
+        rows.append({
+            "posted_at": None if np.isnat(posted[i]) else str(posted[i]),
+            "rate_min_hourly": None if np.isnan(pay["rate_min_hourly"][i]) else float(pay["rate_min_hourly"][i]),
+            "rate_max_hourly": None if np.isnan(pay["rate_max_hourly"][i]) else float(pay["rate_max_hourly"][i]),
+            "pay_currency": pay["currency"][i],
+        })
+    return rows
+
+
+def badge_filter_names(badges: list[str]) -> list[str]:
+    """
+    Map --badge values to BADGE_FLAGS names: flag names ("hybrid", "c2c") or
+    badge text as shown on Dice ("Corp To Corp", "Hybrid in Albany, NY").
+    """
+    names = []
+    for badge in badges:
+        name = badge.strip().lower()
+        if name in BADGE_FLAGS:
+            names.append(name)
+            continue
+        bits = badge_flags({"Other Badges": badge})
+        if not bits:
+            raise ValueError(f"Unknown badge {badge!r}; choose from {', '.join(BADGE_FLAGS)}")
+        names.extend(flag_names(bits))
+    return list(dict.fromkeys(names))
+
+
+def fts_query(text: str) -> str:
+    """Quote each search term so user input can't trip FTS5 query syntax; terms are ANDed."""
+    terms = text.split()
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+class JobStore:
+    """
+    SQLite job store keyed by job URL, with an FTS5 index over title,
+    description and skills. Pages are upserted as they are scraped.
+    """
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def upsert_jobs(self, jobs: list[dict]) -> int:
+        """Insert or update jobs by URL in one transaction. Returns the number stored."""
+        scraped_at = datetime.now().replace(microsecond=0)
+        now = scraped_at.isoformat()
+        jobs = [job for job in jobs if _field(job, "url") is not None]
+        stored = 0
+
+        with self.conn:
+            for job, derived in zip(jobs, derived_columns(jobs, scraped_at)):
+                row = {
+                    **derived,
+                    "url": _field(job, "url"),
+                    "title": _field(job, "Job Title", "title"),
+                    "company": _field(job, "Company Name", "company"),
+                    "location": _field(job, "Location", "location"),
+                    "posted_date": _field(job, "Posted Date"),
+                    "description": _field(job, "Job Description"),
+                    "skills": ", ".join(_as_list(job.get("Primary Skill Set"))) or None,
+                    "data": json.dumps(job, ensure_ascii=False),
+                    "updated_at": now,
+                }
+                job_id = self.conn.execute(UPSERT_SQL, row).fetchone()[0]
+
+                self.conn.execute("DELETE FROM job_badges WHERE job_id = ?", (job_id,))
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO job_badges (job_id, kind, label) VALUES (?, ?, ?)",
+                    [
+                        (job_id, kind, label)
+                        for field, kind in BADGE_FIELDS.items()
+                        for label in _as_list(job.get(field))
+                    ] + [(job_id, FLAG_KIND, name) for name in flag_names(badge_flags(job))],
+                )
+                stored += 1
+
+        logger.info("Store upsert complete | path=%s | jobs=%s", self.path, stored)
+        return stored
+
+    def search(
+            self,
+            query: str | None = None,
+            company: str | None = None,
+            location: str | None = None,
+            badges: list[str] | None = None,
+            posted_within_days: float | None = None,
+            min_rate: float | None = None,
+            currency: str = "USD",
+            sort: str = "relevance",
+            limit: int = 20,
+    ) -> list[dict]:
+        """
+        Full-text search ranked by bm25 (or newest first with sort="posted"),
+        optionally filtered by company (exact, case-insensitive), location
+        prefix, badges (all must match, see badge_filter_names), posted date
+        and minimum hourly rate. min_rate matches jobs whose pay range reaches
+        it; pay without an explicit currency counts as `currency`.
+        """
+        columns = (
+            "j.url, j.title, j.company, j.location, j.posted_date, j.posted_at, "
+            "j.rate_min_hourly, j.rate_max_hourly"
+        )
+        where = []
+        params = []
+
+        if query:
+            sql = f"SELECT {columns}, bm25(jobs_fts) AS rank FROM jobs_fts JOIN jobs j ON j.id = jobs_fts.rowid"
+            where.append("jobs_fts MATCH ?")
+            params.append(fts_query(query))
+            order = "rank"
+        else:
+            sql = f"SELECT {columns}, NULL AS rank FROM jobs j"
+            order = "j.updated_at DESC"
+        if sort == "posted":
+            order = "j.posted_at DESC NULLS LAST"
+
+        if company:
+            where.append("j.company = ?")
+            params.append(company)
+        if location:
+            where.append("j.location LIKE ?")
+            params.append(location.replace("%", "") + "%")
+        if badges:
+            for name in badge_filter_names(badges):
+                where.append(
+                    "EXISTS (SELECT 1 FROM job_badges b WHERE b.job_id = j.id AND b.kind = ? AND b.label = ?)"
+                )
+                params.extend([FLAG_KIND, name])
+        if posted_within_days is not None:
+            cutoff = datetime.now() - timedelta(days=posted_within_days)
+            where.append("j.posted_at >= ?")
+            params.append(cutoff.isoformat(timespec="seconds"))
+        if min_rate is not None:
+            where.append("j.rate_max_hourly >= ? AND (j.pay_currency = ? OR j.pay_currency IS NULL)")
+            params.extend([min_rate, currency])
+
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order} LIMIT ?"
+        params.append(limit)
+
+        return [dict(row) for row in self.conn.execute(sql, params)]
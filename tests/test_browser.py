@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+
+from dice_job_scraper.browser import LOCK_FILE, STORAGE_SNAPSHOT, BrowserProfile
+
+
+def test_profile_lock_and_concurrent_run(tmp_path):
+    (tmp_path / "Default" / "Cache").mkdir(parents=True)
+    (tmp_path / "Default" / "Cache" / "data_0").write_bytes(b"x" * 10)
+
+    first = BrowserProfile(str(tmp_path))
+    assert first.acquire() == {"user_data_dir": str(tmp_path)}
+    assert first.cache_state == "warm"
+    assert (tmp_path / LOCK_FILE).exists()
+
+    # The live profile is not copied or touched: the second run only gets the
+    # owner's storage snapshot
+    (tmp_path / STORAGE_SNAPSHOT).write_text('{"cookies": [], "origins": []}')
+    second = BrowserProfile(str(tmp_path), cache_size_mb=0)
+    assert second.acquire() == {"storage_state": str(tmp_path / STORAGE_SNAPSHOT)}
+    assert second.cache_state == "cold"
+    assert (tmp_path / "Default" / "Cache" / "data_0").exists()
+
+    second.release()
+    assert not BrowserProfile(str(tmp_path)).acquire().get("user_data_dir")
+    first.release()
+
+    # Unlocked, not deleted: the next run locks the same file
+    third = BrowserProfile(str(tmp_path))
+    assert third.acquire() == {"user_data_dir": str(tmp_path)}
+    assert (tmp_path / LOCK_FILE).read_text() == str(os.getpid())
+    third.release()
+
+
+def test_profile_lock_is_released_when_owner_dies(tmp_path):
+    # A crashed run holds no lock: flock goes away with the process
+    child = subprocess.Popen(
+        [sys.executable, "-c", "import os, sys; from dice_job_scraper.browser import BrowserProfile; "
+                               "BrowserProfile(sys.argv[1]).acquire(); os._exit(1)", str(tmp_path)],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    child.wait()
+    assert (tmp_path / LOCK_FILE).read_text() == str(child.pid)
+    profile = BrowserProfile(str(tmp_path))
+    assert profile.acquire() == {"user_data_dir": str(tmp_path)}
+    profile.release()
+
+
+def test_profile_prunes_cache_over_limit(tmp_path):
+    cache = tmp_path / "Default" / "Cache"
+    cache.mkdir(parents=True)
+    (cache / "data_0").write_bytes(b"x" * (2 * 1024 * 1024))
+
+    profile = BrowserProfile(str(tmp_path), cache_size_mb=1)
+    profile.acquire()
+
+    assert not cache.exists()
+    assert profile.cache_state == "cold"
+    profile.release()
+
+
+def test_record_first_listing_reports_warm_and_cold(tmp_path):
+    profile = BrowserProfile(str(tmp_path))
+    profile.cache_state = "cold"
+    profile.record_first_listing(4.0)
+    profile.cache_state = "warm"
+    summary = profile.record_first_listing(1.5)
+
+    assert summary == {
+        "cache": "warm",
+        "seconds": 1.5,
+        "median_warm_s": 1.5,
+        "median_cold_s": 4.0,
+    }
@@ -0,0 +1,51 @@
+import numpy as np
+
+from dice_job_scraper.dedup import DuplicateIndex, MinHasher
+
+DESCRIPTION = (
+    "We are looking for a Java developer with 7+ years of experience building Spring Boot "
+    "microservices on Google Cloud Platform. The resource will move Worker Protection "
+    "applications to the cloud, develop new code and troubleshoot production outages. "
+    "Angular experience is required and a GCP certification is a plus."
+)
+
+
+def test_signatures_are_batched_and_deterministic():
+    hasher = MinHasher(num_perm=64)
+    batch = hasher.signatures([DESCRIPTION, "something else entirely", ""])
+
+    assert batch.shape == (3, 64)
+    assert batch.dtype == np.uint32
+    assert np.array_equal(batch[0], MinHasher(num_perm=64).signatures([DESCRIPTION])[0])
+    assert (batch[2] == np.iinfo(np.uint32).max).all()
+
+
+def test_reposted_job_joins_cluster():
+    index = DuplicateIndex()
+    original = {"url": "https://dice/1", "Job Description": DESCRIPTION}
+    repost = {"url": "https://dice/2", "Job Description": DESCRIPTION.replace("7+", "8+") + " Apply now!"}
+    other = {"url": "https://dice/3", "Job Description": "Python data engineer, Airflow and dbt on AWS."}
+    missing = {"url": "https://dice/4", "Job Description": "Not Available"}
+
+    flags = index.tag([original, repost, other, missing])
+
+    assert flags == [False, True, False, False]
+    assert repost["Duplicate Cluster ID"] == original["Duplicate Cluster ID"]
+    assert repost["Duplicate Of"] == "https://dice/1"
+    assert other["Duplicate Cluster ID"] != original["Duplicate Cluster ID"]
+    assert "Duplicate Cluster ID" not in missing
+
+
+def test_index_round_trip(tmp_path):
+    path = str(tmp_path / "dedup.npz")
+    index = DuplicateIndex()
+    index.tag([{"url": "https://dice/1", "Job Description": DESCRIPTION}])
+    index.save(path)
+
+    loaded = DuplicateIndex.load(path)
+    repost = {"url": "https://dice/9", "Job Description": DESCRIPTION}
+    same = {"url": "https://dice/1", "Job Description": DESCRIPTION}
+
+    assert loaded.tag([repost, same]) == [True, False]
+    assert repost["Duplicate Of"] == "https://dice/1"
+    assert same["Duplicate Of"] == "Not Available"
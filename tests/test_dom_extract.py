@@ -0,0 +1,114 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from dice_job_scraper.dom_extract import (
+    JOB_PAGE_SCRIPT,
+    LIST_PAGE_SCRIPT,
+    build_job_data,
+    build_list_data,
+)
+from dice_job_scraper.job_details import parse_job_page
+from dice_job_scraper.parser import extract_jobs, extract_total_pages
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def evaluate_on_fixture(name: str, script: str, *args):
+    """Load a fixture into headless Chromium and run an extraction script on it."""
+    async_api = pytest.importorskip("playwright.async_api")
+    html = (FIXTURES / name).read_text(encoding="utf-8")
+
+    async def run():
+        async with async_api.async_playwright() as playwright:
+            try:
+                browser = await playwright.chromium.launch()
+            except Exception as e:
+                pytest.skip(f"Chromium not available: {e}")
+            page = await browser.new_page()
+            await page.set_content(html)
+            result = await page.evaluate(script, *args)
+            await browser.close()
+            return result
+
+    return asyncio.run(run())
+
+
+# What JOB_PAGE_SCRIPT / LIST_PAGE_SCRIPT return for the fixtures, written out
+# by hand so the Python half of the DOM path is checked without a browser.
+JOB_DETAIL_PAYLOAD = {
+    "companyName": "Techridge,Inc.",  # get_text(strip=True) joins the two spans' stripped text
+    "companyLink": "https://www.dice.com/company-profile/techridge",
+    "title": "Java Developer (Spring Boot / GCP)",
+    "meta": "Albany, New York • Posted 3 days ago",
+    "badges": ["Contract", "Corp To Corp", "Hybrid in Albany, NY", "$65/hr", "Easy Apply"],
+    "chips": ["Contract - 30 Month(s)", "USD 65.00 per hour", "Hybrid - 3 days in office", "No Travel Required"],
+    "skills": ["Java", "Spring Boot", "Google Cloud Platform"],
+    # The description div's text nodes joined with "\n", then trimmed: the <script> is
+    # skipped and each indentation-only node counts as "\n", as in BeautifulSoup
+    "description": "\n".join([
+        "\n", "Candidate Must Have ", "Google Cloud Platform", " Certificate",
+        "\n", "Rate $65/hrs",
+        "\n", "\n", "84 months of experience creating JAVA programs.",
+        "\n", "60 months of experience working with Spring boot applications.", "\n",
+        "\n", "\n",
+    ]).strip(),
+    "recruiter": {
+        "name": "Subhash Chandra",
+        "title": "Recruitment Specialist @ Techridge, Inc.",
+        "profile": "https://www.dice.com/recruiter/profile/123",
+    },
+}
+
+JOB_LIST_PAYLOAD = {
+    "pagination": "Page 1 of7",
+    "jobs": [
+        # The first <p> whose only text contains a comma is the company line here
+        {"title": "Java Developer", "company": "Techridge, Inc.", "location": "Techridge, Inc.",
+         "url": "https://www.dice.com/job-detail/aaa-111"},
+        # "Remote, <b>USA</b>" has no single string, so no location match
+        {"title": "Senior Java Engineer", "company": "Featured", "location": "N/A",
+         "url": "https://www.dice.com/job-detail/bbb-222"},
+        {"title": "N/A", "company": "N/A", "location": "N/A", "url": "N/A"},
+    ],
+}
+
+
+def test_job_payload_parity_with_html_parser():
+    expected = parse_job_page((FIXTURES / "job_detail.html").read_text(encoding="utf-8"))
+    actual = build_job_data(JOB_DETAIL_PAYLOAD)
+
+    assert actual == expected
+    assert list(actual) == list(expected)
+
+
+def test_list_payload_parity_with_html_parser():
+    html = (FIXTURES / "job_list.html").read_text(encoding="utf-8")
+
+    assert build_list_data(JOB_LIST_PAYLOAD) == (extract_total_pages(html), extract_jobs(html, 10))
+
+
+def test_build_job_data_without_header_card():
+    assert build_job_data(None) == parse_job_page("<html><body></body></html>")
+
+
+def test_job_page_parity_with_html_parser():
+    html = (FIXTURES / "job_detail.html").read_text(encoding="utf-8")
+    raw = evaluate_on_fixture("job_detail.html", JOB_PAGE_SCRIPT)
+
+    expected = parse_job_page(html)
+    actual = build_job_data(raw)
+
+    assert actual == expected
+    assert list(actual) == list(expected)
+
+
+def test_list_page_parity_with_html_parser():
+    html = (FIXTURES / "job_list.html").read_text(encoding="utf-8")
+    raw = evaluate_on_fixture("job_list.html", LIST_PAGE_SCRIPT, 10)
+
+    total_pages, jobs = build_list_data(raw)
+
+    assert total_pages == extract_total_pages(html)
+    assert jobs == extract_jobs(html, 10)
@@ -0,0 +1,129 @@
+from dice_job_scraper.job_details import badge_flags, flags_mask
+from dice_job_scraper.matching import MatchIndex, vectorize
+
+import numpy as np
+
+
+def make_job(url, title, description, skills, arrangement):
+    return {
+        "url": url,
+        "Job Title": title,
+        "Company Name": "Techridge, Inc.",
+        "Location": "Albany, New York",
+        "Job Description": description,
+        "Primary Skill Set": skills,
+        "Work Arrangement": arrangement,
+        "Position Types": ["Corp To Corp"],
+    }
+
+
+JOBS = [
+    make_job("https://dice/1", "Java Developer", "Spring Boot microservices on GCP with Kafka",
+             ["Java", "Spring Boot", "GCP"], ["Hybrid"]),
+    make_job("https://dice/2", "Data Engineer", "Python, Airflow and dbt pipelines on AWS",
+             ["Python", "Airflow", "AWS"], ["Remote"]),
+    make_job("https://dice/3", "Frontend Engineer", "React and TypeScript single page apps",
+             ["React", "TypeScript"], ["Remote"]),
+]
+
+
+def test_vectorize_is_normalized():
+    indptr, indices, values = vectorize(["java spring boot java", ""])
+    assert list(indptr) == [0, 3, 3]
+    assert np.isclose(np.linalg.norm(values), 1.0)
+    assert len(set(indices)) == 3
+
+
+def test_badge_flags():
+    assert badge_flags(JOBS[0]) == flags_mask(["hybrid", "c2c"])
+
+
+def test_index_grows_and_ranks(tmp_path, monkeypatch):
+    monkeypatch.setattr("dice_job_scraper.matching.INITIAL_CAPACITY", 2)
+    index = MatchIndex(str(tmp_path / "index"))
+    index.add_jobs(JOBS[:2])
+    index.add_jobs(JOBS[2:])
+    assert index.capacity >= 3
+
+    # Reopen from disk
+    index = MatchIndex(str(tmp_path / "index"))
+    resume = "Senior Python engineer building Airflow pipelines and dbt models on AWS"
+    results = index.search(resume, top=2)
+    assert results[0]["url"] == "https://dice/2"
+    assert len(results) == 2
+
+    remote_only = index.search("Java Spring Boot", top=5, require=["remote"])
+    assert {job["url"] for job in remote_only} == {"https://dice/2", "https://dice/3"}
+    assert index.search("Java", top=5, exclude=["c2c"]) == []
+
+
+def test_readded_url_overwrites_its_row(tmp_path, monkeypatch):
+    monkeypatch.setattr("dice_job_scraper.matching.GARBAGE_SHARE", 1.0)
+    index = MatchIndex(str(tmp_path / "index"))
+    index.add_jobs(JOBS)
+    index.add_jobs([{**JOBS[0], "Job Description": "Kubernetes operators in Go", "Primary Skill Set": ["Go"]}])
+    assert len(index) == 3
+
+    index = MatchIndex(str(tmp_path / "index"))
+    index.add_jobs([JOBS[1]])
+    assert len(index) == 3
+    assert index.garbage > 0
+
+    results = index.search("Go Kubernetes operators", top=3)
+    assert [job["url"] for job in results][:1] == ["https://dice/1"]
+    assert len(results) == 3
+    assert index.search("Spring Boot Kafka", top=1)[0]["score"] < 0.2
+
+
+def test_compaction_drops_overwritten_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr("dice_job_scraper.matching.GARBAGE_SHARE", 0.0)
+    index = MatchIndex(str(tmp_path / "index"))
+    index.add_jobs(JOBS)
+    df = np.array(index.df)
+    index.add_jobs([{**JOBS[0], "Job Description": "Kubernetes operators in Go", "Primary Skill Set": ["Go"]}])
+    index.add_jobs([JOBS[0]])
+
+    index = MatchIndex(str(tmp_path / "index"))
+    assert (index.count, index.dead, index.garbage) == (3, 0, 0)
+    assert np.array_equal(index.df, df)
+    assert len((tmp_path / "index" / "meta.jsonl").read_text().splitlines()) == 3
+    assert not (tmp_path / "index" / "compact.tmp").exists()
+    assert index.search("Spring Boot Kafka", top=1)[0]["url"] == "https://dice/1"
+
+    index.add_jobs([{**JOBS[2], "Job Description": "Kubernetes operators in Go"}])
+    assert index.search("Go Kubernetes operators", top=1)[0]["url"] == "https://dice/3"
+
+
+def test_scores_match_dense_dot_product(tmp_path, monkeypatch):
+    monkeypatch.setattr("dice_job_scraper.matching.POSTING_BLOCK", 2)
+    rng = np.random.default_rng(1)
+    dim = 64
+    index = MatchIndex(str(tmp_path / "index"), dim=dim)
+    dense = {}
+    for _ in range(6):
+        urls = rng.choice(40, 15, replace=False)
+        vectors = rng.random((15, dim)) * (rng.random((15, dim)) < 0.2)
+        indptr = np.concatenate([[0], np.cumsum((vectors != 0).sum(axis=1))])
+        index.add_vectors([{"url": str(url)} for url in urls], np.zeros(15), indptr,
+                          np.nonzero(vectors)[1], vectors[vectors != 0])
+        dense.update({str(url): vector.astype(np.float16) for url, vector in zip(urls, vectors)})
+
+    query = rng.random(dim).astype(np.float32)
+    rows = index._load_url_rows()
+    scores = index.scores(query)
+    assert len(index) == len(dense)
+    assert all(np.isclose(scores[rows[url]], vector @ query, rtol=1e-3) for url, vector in dense.items())
+
+
+def test_unrelated_jobs_score_near_zero(tmp_path):
+    rng = np.random.default_rng(0)
+    vocabulary = [f"term{i}" for i in range(5000)]
+    jobs = [
+        {"url": f"https://dice/{i}", "Job Description": " ".join(rng.choice(vocabulary, 350))}
+        for i in range(200)
+    ]
+    index = MatchIndex(str(tmp_path / "index"))
+    index.add_jobs(jobs)
+
+    results = index.search("spring boot gcp kafka java", top=5)
+    assert max(job["score"] for job in results) < 0.05
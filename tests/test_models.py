@@ -0,0 +1,88 @@
+import csv
+import pickle
+from dataclasses import fields
+
+from dice_job_scraper.exporter import write_jobs_to_csv
+from dice_job_scraper.models import MISSING, JobRecord, _KEY_SPECS
+
+JOB = {
+    "title": "Senior Java Developer",
+    "company": "Acme Corp",
+    "location": "N/A",
+    "url": "https://www.dice.com/job-detail/abc",
+    "Company Name": "Acme Corp",
+    "Company Link": "Not Available",
+    "Job Title": "Senior Java Developer",
+    "Location": "Austin, TX",
+    "Posted Date": "Posted 3 days ago",
+    "Position Types": ["Contract", "Third Party"],
+    "Work Arrangement": "Hybrid in Austin, TX",
+    "Pay Information": "Not Available",
+    "Other Badges": "Not Available",
+    "Employment Type": "Contract",
+    "Primary Skill Set": ["Java", "Spring", "AWS"],
+    "Job Description": "Build services.",
+    "Recruiter Name": "Jane Doe",
+    "Recruiter Title": "Not Available",
+    "Recruiter Company": "Acme Corp",
+    "Recruiter Profile Link": "Not Available",
+    "Duplicate Cluster ID": "0123456789ab",
+    "Duplicate Of": "Not Available",
+}
+
+
+def test_every_field_has_a_dict_key():
+    attributes = {attr for attr, _, _ in _KEY_SPECS.values()}
+    assert attributes == {field.name for field in fields(JobRecord)} - {"extra", "key_order"}
+
+
+def test_round_trip_preserves_dict_schema():
+    record = JobRecord.from_dict(JOB)
+
+    assert record.to_dict() == JOB
+    assert list(record.to_dict()) == list(JOB)
+    assert list(record.keys()) == list(JOB)
+
+
+def test_round_trip_preserves_source_key_order():
+    job = {"url": "https://www.dice.com/job-detail/x", "Pay": "$60/hr", "source": "feed", "Employment Type": "W2"}
+    first, second = JobRecord.from_dict(job), JobRecord.from_dict(dict(job))
+
+    assert list(first.to_dict()) == list(job)
+    assert first.key_order is second.key_order
+
+
+def test_record_built_directly_uses_schema_order():
+    record = JobRecord(pay="$60/hr", url="https://www.dice.com/job-detail/x", location=MISSING)
+    assert list(record.to_dict().items()) == [
+        ("location", "N/A"), ("url", "https://www.dice.com/job-detail/x"), ("Pay", "$60/hr"),
+    ]
+
+
+def test_missing_values_and_compact_types():
+    record = JobRecord.from_dict(JOB)
+
+    assert record.location is MISSING
+    assert record.company_link is MISSING
+    assert record.pay is None  # key absent, not "Not Available"
+    assert record.primary_skill_set == ("Java", "Spring", "AWS")
+    assert not hasattr(record, "__dict__")
+
+    other = JobRecord.from_dict({"company": "".join(["Acme ", "Corp"])})
+    assert other.company is record.company
+    assert pickle.loads(pickle.dumps(record)).location is MISSING
+
+
+def test_unknown_keys_are_kept():
+    job = {"url": "https://www.dice.com/job-detail/x", "error": "Timeout", "source": "feed"}
+    assert JobRecord.from_dict(job).to_dict() == job
+
+
+def test_csv_from_records_matches_csv_from_dicts(tmp_path):
+    jobs = [{"title": "QA", "company": "N/A", "location": "Remote", "url": "N/A"}, JOB]
+
+    from_dicts = write_jobs_to_csv(jobs, str(tmp_path / "dicts"))
+    from_records = write_jobs_to_csv([JobRecord.from_dict(job) for job in jobs], str(tmp_path / "records"))
+
+    with from_dicts.open(encoding="utf-8") as a, from_records.open(encoding="utf-8") as b:
+        assert list(csv.reader(a)) == list(csv.reader(b))
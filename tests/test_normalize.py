@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import numpy as np
+
+from dice_job_scraper.normalize import normalize_pay, normalize_posted, pay_text
+
+
+def test_normalize_pay_to_hourly():
+    result = normalize_pay([
+        "$65/hr",
+        "USD 120,000 - 140,000 per year",
+        "W2 $60 - $70/hr",
+        "$700/day",
+        "120k",
+        "Depends on experience",
+        None,
+    ])
+
+    np.testing.assert_allclose(
+        result["rate_min_hourly"],
+        [65.0, 120_000 / 2080, 60.0, 87.5, 120_000 / 2080, np.nan, np.nan],
+    )
+    np.testing.assert_allclose(
+        result["rate_max_hourly"],
+        [65.0, 140_000 / 2080, 70.0, 87.5, 120_000 / 2080, np.nan, np.nan],
+    )
+    assert list(result["currency"]) == ["USD", "USD", "USD", "USD", None, None, None]
+
+
+def test_normalize_posted_relative_to_reference():
+    reference = datetime(2026, 10, 19, 12, 0, 0)
+    posted = normalize_posted(
+        ["Posted 3 days ago", "Posted today", "Posted 30+ days ago", "Posted Jan 10, 2026", "Not Available"],
+        reference,
+    )
+
+    assert posted[0] == np.datetime64("2026-10-16T12:00:00")
+    assert posted[1] == np.datetime64("2026-10-19T12:00:00")
+    assert posted[2] == np.datetime64("2026-09-19T12:00:00")
+    assert posted[3] == np.datetime64("2026-01-10T00:00:00")
+    assert np.isnat(posted[4])
+
+
+def test_pay_text_prefers_badges():
+    assert pay_text({"Pay Information": ["$65/hr"], "Pay": "USD 60.00 per hour"}) == "$65/hr"
+    assert pay_text({"Pay Information": "Not Available", "Pay": "$55/hr"}) == "$55/hr"
+    assert pay_text({"Pay Information": ["DOE"]}) is None
+
+
+def test_normalize_pay_merges_range_with_units_on_both_sides():
+    result = normalize_pay(["$50/hr - $60/hr", "USD 50 per hour to USD 60 per hour", "$50/hr - $100,000/yr"])
+
+    np.testing.assert_allclose(result["rate_min_hourly"], [50.0, 50.0, 50.0])
+    np.testing.assert_allclose(result["rate_max_hourly"], [60.0, 60.0, 50.0])
@@ -0,0 +1,83 @@
+import asyncio
+import json
+import time
+
+from dice_job_scraper.profiling import RunProfiler, profile_section
+
+
+def test_profile_section_is_noop_without_profiler():
+    with profile_section("parse_job_page"):
+        value = 1
+    assert value == 1
+
+
+def test_run_profiler_writes_reports(tmp_path):
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return sum(range(1000))
+
+    async def run():
+        profiler = RunProfiler(str(tmp_path), top_n=5)
+        profiler.start(asyncio.get_running_loop())
+        with profile_section("scrape_loop"):
+            await asyncio.create_task(fetch())
+            with profile_section("parse_job_page"):
+                sum(range(1000))
+        return profiler.stop()
+
+    summary = asyncio.run(run())
+
+    assert summary["sections"]["scrape_loop"]["calls"] == 1
+    assert summary["sections"]["parse_job_page"]["calls"] == 1
+    assert any(name.endswith("fetch") for name in summary["tasks"])
+    for path in summary["files"].values():
+        assert (tmp_path / path.split("/")[-1]).exists()
+    assert json.loads(next(tmp_path.glob("*_summary.json")).read_text())
+
+
+def test_blocking_sleep_counts_as_busy(tmp_path):
+    async def blocking_step():
+        with profile_section("scrape_loop"):
+            time.sleep(0.3)  # holds the loop without using CPU
+            await asyncio.sleep(0.2)
+
+    async def run():
+        profiler = RunProfiler(str(tmp_path), top_n=5)
+        profiler.start(asyncio.get_running_loop())
+        await asyncio.create_task(blocking_step())
+        return profiler.stop()
+
+    summary = asyncio.run(run())
+
+    section = summary["sections"]["scrape_loop"]
+    assert section["busy_s"] >= 0.3
+    assert 0.15 <= section["waiting_s"] < 0.3
+    assert section["cpu_s"] < 0.1
+    task = next(stats for name, stats in summary["tasks"].items() if name.endswith("blocking_step"))
+    assert task["busy_s"] >= 0.3
+    assert task["max_step_s"] >= 0.3
+
+
+def test_allocations_are_scoped_to_sections(tmp_path):
+    held = []
+
+    async def run():
+        profiler = RunProfiler(str(tmp_path), top_n=5)
+        profiler.start(asyncio.get_running_loop())
+        before = bytearray(4 * 1024 * 1024)  # allocated outside any section
+        with profile_section("scrape_loop"):
+            held.append(bytearray(1024 * 1024))
+            with profile_section("parse_job_page"):
+                transient = bytearray(8 * 1024 * 1024)
+                del transient
+        del before
+        return profiler.stop()
+
+    summary = asyncio.run(run())
+
+    assert summary["sections"]["parse_job_page"]["peak_traced_mib"] >= 8
+    assert summary["sections"]["scrape_loop"]["peak_traced_mib"] >= 8
+    report = next(tmp_path.glob("*_alloc.txt")).read_text()
+    assert "grown during scrape_loop" in report
+    assert "test_profiling.py" in report.splitlines()[1]  # held buffer is the top growth
+    assert "Net allocated during scrape_loop: +10" in report
@@ -0,0 +1,61 @@
+import json
+
+import math
+
+from dice_job_scraper.report import SeenUrls, build_report, format_report
+
+
+def test_build_report_groups_rates(tmp_path):
+    jobs = [
+        {"url": "1", "Pay Information": ["$60/hr"], "Primary Skill Set": ["Java", "GCP"],
+         "Location": "Albany, New York", "Work Arrangement": "Hybrid - 3 days in office"},
+        {"url": "2", "Pay Information": ["$80/hr"], "Primary Skill Set": ["Java"],
+         "Location": "Austin, Texas", "Work Arrangement": ["Remote"]},
+        {"url": "3", "Pay Information": "Not Available", "Primary Skill Set": ["Java"],
+         "Location": "Austin, Texas", "Work Arrangement": ["Remote"]},
+        {"url": "4", "Pay Information": ["€90/hour"], "Primary Skill Set": ["Java"]},
+    ]
+    path = tmp_path / "dice_jobs_2026-10-19_12-00-00.jsonl"
+    path.write_text("".join(json.dumps(job) + "\n" for job in jobs), encoding="utf-8")
+
+    report = build_report([str(tmp_path)], batch_size=2)
+
+    assert report["jobs_read"] == 4
+    assert report["jobs_with_rate"] == 2
+    skills = {row["group"]: row for row in report["skill"]}
+    assert skills["java"]["jobs"] == 2
+    assert (skills["java"]["min"], skills["java"]["max"], skills["java"]["mean"]) == (60.0, 80.0, 70.0)
+    assert skills["gcp"]["jobs"] == 1
+    assert {row["group"] for row in report["work_arrangement"]} == {"Hybrid", "Remote"}
+    assert "By location" in format_report(report)
+
+
+def test_build_report_counts_rescraped_jobs_once(tmp_path):
+    older = [{"url": "1", "Pay Information": ["$60/hr"]}, {"url": "2", "Pay Information": ["$70/hr"]}]
+    newer = [{"url": "1", "Pay Information": ["$65/hr"]}, {"url": "1", "Pay Information": ["$65/hr"]},
+             {"url": "N/A", "Pay Information": ["$90/hr"]}]
+    for name, jobs in (("2026-10-18_12-00-00", older), ("2026-10-19_12-00-00", newer)):
+        path = tmp_path / f"dice_jobs_{name}.jsonl"
+        path.write_text("".join(json.dumps(job) + "\n" for job in jobs), encoding="utf-8")
+
+    report = build_report([str(tmp_path)], batch_size=2)
+
+    assert report["jobs_read"] == 5
+    assert report["jobs_duplicate"] == 2
+    overall = report["overall"][0]
+    assert overall["jobs"] == 3
+    assert (overall["min"], overall["max"]) == (65.0, 90.0)
+
+
+def test_seen_urls_keeps_logarithmic_runs():
+    seen = SeenUrls()
+    batches = 4000
+    for batch in range(batches):
+        # 50 new URLs per batch, then repeats from an earlier batch and from this one
+        urls = [f"https://dice/{batch}-{i}" for i in range(50)]
+        keep = seen.first_seen(urls + [f"https://dice/{batch // 2}-0", urls[1]])
+        assert keep[:50].all() and not keep[50:].any()
+
+    assert len(seen) == batches * 50
+    assert len(seen._runs) <= math.log2(batches * 50) + 1
+    assert all(len(a) > 2 * len(b) for a, b in zip(seen._runs, seen._runs[1:]))
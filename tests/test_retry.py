@@ -0,0 +1,99 @@
+import asyncio
+
+from dice_job_scraper.retry import CircuitBreaker, RetryPolicy, RetryQueue, classify_error, sleep_or_shutdown
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TimeoutError(Exception):
+    """Stand-in for playwright's TimeoutError (matched by class name)."""
+
+
+def test_classify_error():
+    assert classify_error(TimeoutError("Timeout 30000ms exceeded")) == "TimeoutError"
+    assert classify_error(Exception("net::ERR_CONNECTION_RESET")) == "NetworkError"
+    assert classify_error(ValueError("boom")) == "default"
+
+
+def test_retry_queue_backoff_and_give_up():
+    clock = FakeClock()
+    queue = RetryQueue(
+        policies={"default": RetryPolicy(max_retries=2, base_delay=10.0, max_delay=15.0)},
+        clock=clock,
+    )
+    job = {"url": "https://www.dice.com/job-detail/1"}
+
+    assert queue.push(job, ValueError("boom"))
+    assert queue.pop_due() == []
+
+    clock.now = 10.0
+    [item] = queue.pop_due()
+    assert item.attempts == 1
+
+    assert queue.push(job, ValueError("boom"), attempts=item.attempts)
+    assert queue.seconds_until_next() == 15.0  # 20s backoff capped at max_delay
+
+    clock.now = 25.0
+    [item] = queue.pop_due()
+    assert not queue.push(job, ValueError("boom"), attempts=item.attempts)
+    assert queue.stats["gave_up"] == 1
+    assert queue.stats["errors_by_class"] == {"default": 3}
+
+
+def test_retry_queue_save_and_load(tmp_path):
+    clock = FakeClock()
+    queue = RetryQueue(clock=clock)
+    path = tmp_path / "retry_queue.jsonl"
+    queue.push({"url": "https://www.dice.com/job-detail/1"}, TimeoutError("Timeout"))
+    queue.push({"url": "https://www.dice.com/job-detail/2"}, ValueError("boom"))
+    clock.now = 10.0
+    queue.save(path)
+
+    restored = RetryQueue(clock=FakeClock())
+    assert restored.load(path) == 2
+    assert restored.stats["restored"] == 2
+    assert [item.job["url"] for item in restored.pop_due()] == ["https://www.dice.com/job-detail/2"]
+    assert restored.seconds_until_next() == 5.0  # 15s timeout backoff, 10s of it already waited
+    assert restored.pop_due() == [] and len(restored) == 1
+
+    restored.abandon_all()
+    restored.save(path)
+    assert not path.exists()
+    assert RetryQueue().load(path) == 0
+
+
+def test_circuit_breaker_opens_pauses_and_closes():
+    clock = FakeClock()
+    breaker = CircuitBreaker(window=4, failure_threshold=0.5, min_calls=4, cooldown=0.0, clock=clock)
+
+    for success in (True, False, True, False):
+        breaker.record(success)
+    assert breaker.state == "open"
+    assert breaker.stats["opened"] == 1
+
+    asyncio.run(breaker.wait_until_closed())
+    assert breaker.state == "half_open"
+
+    breaker.record(False)
+    assert breaker.state == "open"
+
+    asyncio.run(breaker.wait_until_closed())
+    breaker.record(True)
+    assert breaker.state == "closed"
+
+
+def test_sleep_or_shutdown_returns_early_on_shutdown():
+    async def run():
+        shutdown_event = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.05, shutdown_event.set)
+        start = asyncio.get_running_loop().time()
+        await sleep_or_shutdown(60, shutdown_event)
+        return asyncio.get_running_loop().time() - start
+
+    assert asyncio.run(run()) < 1
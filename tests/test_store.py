@@ -0,0 +1,80 @@
+import pytest
+
+from dice_job_scraper.store import JobStore, fts_query
+
+
+def make_job(url, title, description, **extra):
+    job = {
+        "title": title,
+        "company": "N/A",
+        "location": "N/A",
+        "url": url,
+        "Company Name": "Techridge, Inc.",
+        "Job Title": title,
+        "Location": "Albany, New York",
+        "Posted Date": "Posted 3 days ago",
+        "Position Types": ["Contract"],
+        "Work Arrangement": ["Hybrid"],
+        "Pay Information": ["$65/hr"],
+        "Other Badges": "Not Available",
+        "Primary Skill Set": ["Java", "Spring Boot"],
+        "Job Description": description,
+    }
+    job.update(extra)
+    return job
+
+
+def test_fts_query_quotes_terms():
+    assert fts_query('spring "boot" c++') == '"spring" """boot""" "c++"'
+
+
+def test_upsert_and_search(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    store.upsert_jobs([
+        make_job("https://dice/1", "Java Developer", "Spring Boot services on GCP"),
+        make_job("https://dice/2", "Python Developer", "Django on AWS",
+                 **{"Work Arrangement": ["Remote"], "Company Name": "Acme"}),
+    ])
+
+    assert [job["url"] for job in store.search("spring gcp")] == ["https://dice/1"]
+    assert [job["url"] for job in store.search("developer", badges=["remote"])] == ["https://dice/2"]
+    assert [job["url"] for job in store.search(company="acme")] == ["https://dice/2"]
+    assert len(store.search(location="albany")) == 2
+    assert store.search("kubernetes") == []
+
+    # Re-scraping the same URL updates the row and its FTS entry in place
+    store.upsert_jobs([make_job("https://dice/1", "Java Developer", "Kubernetes platform work")])
+    assert [job["url"] for job in store.search("kubernetes")] == ["https://dice/1"]
+    assert store.search("gcp") == []
+    assert store.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 2
+    store.close()
+
+
+def test_badge_posted_and_rate_filters(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    store.upsert_jobs([
+        make_job("https://dice/1", "Java Developer", "Spring Boot services on GCP",
+                 **{"Work Arrangement": ["Hybrid in Albany, NY"], "Other Badges": ["Corp To Corp"]}),
+        make_job("https://dice/2", "Java Developer", "Spring Boot services on GCP",
+                 **{"Pay Information": ["$50/hr"], "Posted Date": "Posted 30+ days ago"}),
+        make_job("https://dice/3", "Java Developer", "Spring Boot services on GCP",
+                 **{"Work Arrangement": ["Remote"], "Pay Information": "Not Available"}),
+    ])
+
+    def urls(**filters):
+        return sorted(job["url"] for job in store.search("spring boot gcp", **filters))
+
+    assert urls(badges=["Hybrid"]) == ["https://dice/1", "https://dice/2"]
+    assert urls(badges=["Corp To Corp"]) == ["https://dice/1"]
+    assert urls(badges=["c2c", "hybrid"]) == ["https://dice/1"]
+    assert urls(min_rate=60) == ["https://dice/1"]
+    assert urls(posted_within_days=7) == ["https://dice/1", "https://dice/3"]
+    assert urls(badges=["hybrid"], min_rate=60, posted_within_days=7) == ["https://dice/1"]
+
+    newest = store.search("spring", sort="posted")
+    assert newest[-1]["url"] == "https://dice/2"
+    assert newest[0]["posted_at"] > newest[-1]["posted_at"]
+    with pytest.raises(ValueError):
+        store.search("spring", badges=["Part Time"])
+    store.close()
+